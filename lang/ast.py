@@ -4,26 +4,26 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class StructField:
     name: str
     type_expr: "TypeExpr"
 
 
-@dataclass
+@dataclass(slots=True)
 class StructDef:
     name: str
     fields: List[StructField]
     loc: "Located"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionArg:
     name: str
     type_expr: "TypeExpr"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionDef:
     name: str
     args: List[ExceptionArg]
@@ -31,35 +31,41 @@ class ExceptionDef:
     domain: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Located:
     line: int
     column: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeExpr:
     name: str
     args: List["TypeExpr"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Param:
     name: str
     type_expr: TypeExpr
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     statements: List["Stmt"]
 
 
 class Stmt:
+    """Base statement node; KIND indexes the checker and SSA lowering statement tables."""
+
+    __slots__ = ()
+
     loc: Located
 
 
-@dataclass
+@dataclass(slots=True)
 class LetStmt(Stmt):
+    KIND = 0
+
     loc: Located
     name: str
     type_expr: Optional[TypeExpr]
@@ -69,41 +75,51 @@ class LetStmt(Stmt):
     capture_alias: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(Stmt):
+    KIND = 1
+
     loc: Located
     target: "Expr"
     value: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Stmt):
+    KIND = 2
+
     loc: Located
     condition: "Expr"
     then_block: "Block"
     else_block: Optional["Block"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Stmt):
+    KIND = 3
+
     loc: Located
     value: Optional["Expr"]
 
 
-@dataclass
+@dataclass(slots=True)
 class RaiseStmt(Stmt):
+    KIND = 4
+
     loc: Located
     value: "Expr"
     domain: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(Stmt):
+    KIND = 5
+
     loc: Located
     value: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDef:
     name: str
     params: Sequence[Param]
@@ -113,82 +129,106 @@ class FunctionDef:
 
 
 class Expr:
+    """Base expression node; KIND indexes Checker._expr_dispatch."""
+
+    __slots__ = ()
+
     loc: Located
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expr):
+    KIND = 0
+
     loc: Located
     value: object
 
 
-@dataclass
+@dataclass(slots=True)
 class Name(Expr):
+    KIND = 1
+
     loc: Located
     ident: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Placeholder(Expr):
+    KIND = 2
+
     loc: Located
 
 
-@dataclass
+@dataclass(slots=True)
 class Attr(Expr):
+    KIND = 3
+
     loc: Located
     value: Expr
     attr: str
 
 
-@dataclass
+@dataclass(slots=True)
 class KwArg:
     name: str
     value: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Expr):
+    KIND = 4
+
     loc: Located
     func: Expr
     args: List[Expr]
     kwargs: List[KwArg]
 
 
-@dataclass
+@dataclass(slots=True)
 class Binary(Expr):
+    KIND = 5
+
     loc: Located
     op: str
     left: Expr
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Unary(Expr):
+    KIND = 6
+
     loc: Located
     op: str
     operand: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Move(Expr):
+    KIND = 7
+
     loc: Located
     value: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Index(Expr):
+    KIND = 8
+
     loc: Located
     value: Expr
     index: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayLiteral(Expr):
+    KIND = 9
+
     loc: Located
     elements: List[Expr]
 
 
-@dataclass
+@dataclass(slots=True)
 class Program:
     functions: List[FunctionDef]
     statements: List[Stmt]
@@ -197,14 +237,16 @@ class Program:
     module: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStmt(Stmt):
+    KIND = 6
+
     loc: Located
     path: List[str]
     alias: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CatchClause:
     event: Optional[str]
     binder: Optional[str]
@@ -213,44 +255,58 @@ class CatchClause:
     arg_order: Optional[list[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TryStmt(Stmt):
+    KIND = 7
+
     loc: Located
     body: Block
     catches: List[CatchClause]
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Stmt):
+    KIND = 8
+
     loc: Located
     condition: "Expr"
     body: Block
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmt(Stmt):
+    KIND = 9
+
     loc: Located
     var: str
     iter_expr: "Expr"
     body: Block
 
-@dataclass
+@dataclass(slots=True)
 class BreakStmt(Stmt):
+    KIND = 10
+
     loc: Located
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStmt(Stmt):
+    KIND = 11
+
     loc: Located
 
-@dataclass
+@dataclass(slots=True)
 class ThrowStmt(Stmt):
+    KIND = 12
+
     loc: Located
     expr: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionCtor(Expr):
     """Semantic node representing an exception constructor application."""
 
+    KIND = 10
+
     loc: Located
     name: str
     event_code: int
@@ -258,23 +314,32 @@ class ExceptionCtor(Expr):
     arg_order: Optional[list[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CatchExprArm:
     event: Optional[str]
     binder: Optional[str]
     block: Block
+    event_code: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TryCatchExpr(Expr):
+    KIND = 11
+
     loc: Located
     attempt: Expr
     catch_arms: List[CatchExprArm]
 
 
-@dataclass
+@dataclass(slots=True)
 class Ternary(Expr):
+    KIND = 12
+
     loc: Located
     condition: Expr
     then_value: Expr
     else_value: Expr
+
+
+STMT_KIND_COUNT = 13
+EXPR_KIND_COUNT = 13
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set
 
 from . import ast
 from .types import (
@@ -97,8 +98,12 @@ RESERVED_IDENTIFIERS = frozenset(
     }
 )
 
+_LITERAL_TYPES: Dict[type, Type] = {bool: BOOL, int: INT, float: F64, str: STR}
+# Location for compiler-provided bindings (e.g. `out`); Located is frozen, so one instance is shared.
+_ZERO_LOC = ast.Located(line=0, column=0)
 
-@dataclass
+
+@dataclass(slots=True)
 class VarInfo:
     type: Type
     mutable: bool
@@ -115,7 +120,7 @@ class FunctionInfo:
 class CheckedProgram:
     program: ast.Program
     functions: Dict[str, FunctionInfo]
-    globals: Dict[str, VarInfo]
+    globals: Mapping[str, VarInfo]
     structs: Dict[str, "StructInfo"]
     exceptions: Dict[str, "ExceptionInfo"]
     module: Optional[str] = None
@@ -158,11 +163,35 @@ class CheckError(Exception):
     pass
 
 
+def _base_numeric(t: Type) -> Type:
+    if isinstance(t, ReferenceType):
+        return t.args[0]
+    return t
+
+
+def _kind_table(size: int, handlers: Dict[type, Callable]) -> List[Optional[Callable]]:
+    table: List[Optional[Callable]] = [None] * size
+    for node_cls, handler in handlers.items():
+        table[node_cls.KIND] = handler
+    return table
+
+
+def _type_expr_key(type_expr: ast.TypeExpr) -> object:
+    if not type_expr.args:
+        return type_expr.name
+    return (type_expr.name, tuple(_type_expr_key(arg) for arg in type_expr.args))
+
+
 class Scope:
+    """Lexical scope; `vars` holds own bindings, `_visible` a flattened view seeded from the parent on push."""
+
+    __slots__ = ("parent", "vars", "capture_keys", "_visible")
+
     def __init__(self, parent: Optional[Scope] = None) -> None:
         self.parent = parent
         self.vars: Dict[str, VarInfo] = {}
         self.capture_keys: Set[str] = set()
+        self._visible: Dict[str, VarInfo] = dict(parent._visible) if parent is not None else {}
 
     def define(self, name: str, info: VarInfo, loc: ast.Located, capture_key: Optional[str] = None) -> None:
         if name in self.vars:
@@ -177,16 +206,16 @@ class Scope:
             self.capture_keys.add(capture_key)
             info.capture_key = capture_key
         self.vars[name] = info
+        self._visible[name] = info
 
     def lookup(self, name: str, loc: ast.Located) -> VarInfo:
-        if name in self.vars:
-            return self.vars[name]
-        if self.parent:
-            return self.parent.lookup(name, loc)
-        raise CheckError(f"{loc.line}:{loc.column}: Unknown identifier '{name}'")
+        info = self._visible.get(name)
+        if info is None:
+            raise CheckError(f"{loc.line}:{loc.column}: Unknown identifier '{name}'")
+        return info
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionContext:
     name: str
     signature: FunctionSignature
@@ -196,8 +225,10 @@ class FunctionContext:
 
 
 class Checker:
-    def __init__(self, builtin_functions: Dict[str, FunctionSignature]) -> None:
-        self.function_infos: Dict[str, FunctionInfo] = {
+    def __init__(self, builtin_functions: Mapping[str, FunctionSignature]) -> None:
+        # User-defined and synthesized callees are probed before the builtin table.
+        self._user_infos: Dict[str, FunctionInfo] = {}
+        self._builtin_infos: Dict[str, FunctionInfo] = {
             name: FunctionInfo(signature=sig, node=None)
             for name, sig in builtin_functions.items()
         }
@@ -205,6 +236,37 @@ class Checker:
         self.exception_infos: Dict[str, ExceptionInfo] = {}
         self.module_name: str = ""
         self.exception_metadata: List[ExceptionMeta] = []
+        self._type_cache: Dict[object, Type] = {}
+        # Dense KIND-indexed tables; node kinds without a handler stay None.
+        self._stmt_dispatch = _kind_table(ast.STMT_KIND_COUNT, {
+            ast.LetStmt: self._check_let,
+            ast.AssignStmt: self._check_assign,
+            ast.ReturnStmt: self._check_return,
+            ast.RaiseStmt: self._check_raise,
+            ast.ExprStmt: self._check_expr_stmt,
+            ast.ImportStmt: self._check_import,
+            ast.IfStmt: self._check_if,
+            ast.WhileStmt: self._check_while,
+            ast.ForStmt: self._check_for,
+            ast.TryStmt: self._check_try,
+            ast.BreakStmt: self._check_break,
+            ast.ContinueStmt: self._check_continue,
+        })
+        self._expr_dispatch = _kind_table(ast.EXPR_KIND_COUNT, {
+            ast.Literal: self._check_literal,
+            ast.Name: self._check_name,
+            ast.Call: self._check_call,
+            ast.ExceptionCtor: self._check_exception_ctor,
+            ast.Attr: self._check_attr,
+            ast.Move: self._check_move,
+            ast.ArrayLiteral: self._check_array_literal,
+            ast.Index: self._check_index_expr,
+            ast.TryCatchExpr: self._check_try_catch_expr,
+            ast.Ternary: self._check_ternary,
+            ast.Placeholder: self._check_placeholder,
+            ast.Unary: self._check_unary,
+            ast.Binary: self._check_binary,
+        })
 
     def check(self, program: ast.Program) -> CheckedProgram:
         if program.module:
@@ -214,7 +276,7 @@ class Checker:
         self._register_structs(program.structs)
         self._register_functions(program.functions)
         global_scope = Scope()
-        global_scope.define("out", VarInfo(type=CONSOLE_OUT, mutable=False), ast.Located(line=0, column=0))
+        global_scope.define("out", VarInfo(type=CONSOLE_OUT, mutable=False), _ZERO_LOC)
         module_ctx = FunctionContext(
             name="<module>",
             signature=FunctionSignature(
@@ -231,13 +293,30 @@ class Checker:
         return CheckedProgram(
             program=program,
             functions=self.function_infos,
-            globals=global_scope.vars.copy(),
+            globals=MappingProxyType(global_scope.vars),
             structs=self.struct_infos,
             exceptions=self.exception_infos,
             module=program.module,
             exception_metadata=self.exception_metadata,
         )
 
+    @property
+    def function_infos(self) -> Dict[str, FunctionInfo]:
+        """Merged view of builtin and user callees (builtins first, as registered)."""
+        return {**self._builtin_infos, **self._user_infos}
+
+    def _function_info(self, name: str) -> Optional[FunctionInfo]:
+        return self._user_infos.get(name) or self._builtin_infos.get(name)
+
+    def _resolve(self, type_expr: ast.TypeExpr) -> Type:
+        """Resolve a type expression, reusing the result for structurally equal expressions."""
+        key = _type_expr_key(type_expr)
+        ty = self._type_cache.get(key)
+        if ty is None:
+            ty = resolve_type(type_expr)
+            self._type_cache[key] = ty
+        return ty
+
     def _validate_module_name(self, name: str) -> None:
         import re
         if len(name.encode("utf-8")) > 254:
@@ -259,7 +338,7 @@ class Checker:
             arg_types: Dict[str, Type] = {}
             for arg in exc.args:
                 try:
-                    ty = resolve_type(arg.type_expr)
+                    ty = self._resolve(arg.type_expr)
                 except TypeSystemError as exc_err:
                     raise CheckError(f"{arg.type_expr.name}: {exc_err}") from exc_err
                 if arg.name in arg_types:
@@ -305,7 +384,7 @@ class Checker:
                 )
             view_struct.methods.update(view_methods)
             for sig in view_methods.values():
-                self.function_infos[sig.name] = FunctionInfo(signature=sig, node=None)
+                self._user_infos[sig.name] = FunctionInfo(signature=sig, node=None)
             exc_info.arg_key_struct = key_struct
             exc_info.args_view_struct = view_struct
             self.exception_infos[exc.name] = exc_info
@@ -317,11 +396,11 @@ class Checker:
         for fn in functions:
             if fn.name in RESERVED_IDENTIFIERS:
                 raise CheckError(f"{fn.loc.line}:{fn.loc.column}: '{fn.name}' is a reserved keyword")
-            if fn.name in self.function_infos:
+            if self._function_info(fn.name) is not None:
                 raise CheckError(f"{fn.loc.line}:{fn.loc.column}: Function '{fn.name}' already defined")
             try:
-                param_types = tuple(resolve_type(param.type_expr) for param in fn.params)
-                return_type = resolve_type(fn.return_type)
+                param_types = tuple(self._resolve(param.type_expr) for param in fn.params)
+                return_type = self._resolve(fn.return_type)
             except TypeSystemError as exc:
                 raise CheckError(str(exc)) from exc
             if return_type == ERROR:
@@ -332,7 +411,7 @@ class Checker:
                 return_type=return_type,
                 effects=None,
             )
-            self.function_infos[fn.name] = FunctionInfo(signature=signature, node=fn)
+            self._user_infos[fn.name] = FunctionInfo(signature=signature, node=fn)
             # If the first parameter is a struct type, also register a method-style callee.
             if param_types:
                 recv_ty = param_types[0]
@@ -364,7 +443,7 @@ class Checker:
         field_types: Dict[str, Type] = {}
         for field in fields:
             try:
-                ty = resolve_type(field.type_expr)
+                ty = self._resolve(field.type_expr)
             except TypeSystemError as exc:
                 raise CheckError(f"{field.type_expr.name}: {exc}") from exc
             if field.name in field_types:
@@ -381,11 +460,11 @@ class Checker:
             return_type=Type(name),
             effects=None,
         )
-        self.function_infos[name] = FunctionInfo(signature=signature, node=None)
+        self._user_infos[name] = FunctionInfo(signature=signature, node=None)
         return struct_info
 
     def _check_function(self, fn: ast.FunctionDef, global_scope: Scope) -> None:
-        info = self.function_infos[fn.name]
+        info = self._user_infos[fn.name]
         scope = Scope(parent=global_scope)
         for param, ty in zip(fn.params, info.signature.params):
             is_mut = ty.name in {"&", "&mut"}
@@ -399,203 +478,198 @@ class Checker:
         )
         for stmt in fn.body.statements:
             self._check_stmt(stmt, ctx, in_loop=False)
-        self.function_infos[fn.name] = FunctionInfo(
-            signature=info.signature,
-            node=fn,
-        )
+        # _register_functions already records the node; only rebuild the entry if it drifted.
+        if info.node is not fn:
+            self._user_infos[fn.name] = FunctionInfo(
+                signature=info.signature,
+                node=fn,
+            )
 
     def _check_stmt(self, stmt: ast.Stmt, ctx: FunctionContext, in_loop: bool = False) -> None:
-        if isinstance(stmt, ast.LetStmt):
-            if stmt.name.startswith("_t"):
-                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: identifiers starting with '_t' are reserved")
-            decl_type = None
-            if stmt.type_expr is not None:
-                try:
-                    decl_type = resolve_type(stmt.type_expr)
-                except TypeSystemError as exc:
-                    raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: {exc}") from exc
-            value_type = self._check_expr(stmt.value, ctx)
-            if decl_type is None:
-                decl_type = value_type
-            else:
-                self._expect_type(value_type, decl_type, stmt.loc)
-            capture_key = None
-            if stmt.capture:
-                capture_key = stmt.capture_alias or stmt.name
-            ctx.scope.define(
-                stmt.name,
-                VarInfo(type=decl_type, mutable=stmt.mutable),
-                stmt.loc,
-                capture_key=capture_key,
-            )
-            return
-        if isinstance(stmt, ast.AssignStmt):
-            expected_type = self._check_assignment_target(stmt.target, ctx)
-            value_type = self._check_expr(stmt.value, ctx)
-            self._expect_type(value_type, expected_type, stmt.value.loc)
-            return
-        if isinstance(stmt, ast.ReturnStmt):
-            if not ctx.allow_returns:
-                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Return outside function")
-            if stmt.value is None:
-                self._expect_type(UNIT, ctx.signature.return_type, stmt.loc)
-            else:
-                value_type = self._check_expr(stmt.value, ctx)
-                self._expect_type(value_type, ctx.signature.return_type, stmt.loc)
-            return
-        if isinstance(stmt, ast.RaiseStmt):
-            # Special-case exception constructors in throw/raise.
-            if isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, (ast.Name, ast.Attr)):
-                callee_name = self._resolve_callee(stmt.value.func, ctx)
-                exc_info = self.exception_infos.get(callee_name)
-                if exc_info:
-                    fields = self._check_exception_constructor(stmt.value, exc_info, ctx, collect=True)
-                    stmt.value = ast.ExceptionCtor(
-                        loc=stmt.loc,
-                        name=exc_info.name,
-                        event_code=exc_info.event_code,
-                        fields=fields,
-                        arg_order=exc_info.arg_order.copy(),
-                    )
-                    return
-                # If it isn't an exception and also not a known callable, report as unknown exception.
-                is_known_callable = callee_name in self.function_infos or callee_name in self.struct_infos
-                if not is_known_callable and isinstance(stmt.value.func, ast.Name):
-                    raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Unknown exception '{callee_name}'")
+        handler = self._stmt_dispatch[stmt.KIND]
+        if handler is None:
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Unsupported statement {stmt}")
+        handler(stmt, ctx, in_loop)
+
+    def _check_let(self, stmt: ast.LetStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        if stmt.name.startswith("_t"):
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: identifiers starting with '_t' are reserved")
+        decl_type = None
+        if stmt.type_expr is not None:
+            try:
+                decl_type = self._resolve(stmt.type_expr)
+            except TypeSystemError as exc:
+                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: {exc}") from exc
+        value_type = self._check_expr(stmt.value, ctx)
+        if decl_type is None:
+            decl_type = value_type
+        else:
+            self._expect_type(value_type, decl_type, stmt.loc)
+        capture_key = None
+        if stmt.capture:
+            capture_key = stmt.capture_alias or stmt.name
+        ctx.scope.define(
+            stmt.name,
+            VarInfo(type=decl_type, mutable=stmt.mutable),
+            stmt.loc,
+            capture_key=capture_key,
+        )
+
+    def _check_assign(self, stmt: ast.AssignStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        expected_type = self._check_assignment_target(stmt.target, ctx)
+        value_type = self._check_expr(stmt.value, ctx)
+        self._expect_type(value_type, expected_type, stmt.value.loc)
+
+    def _check_return(self, stmt: ast.ReturnStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        if not ctx.allow_returns:
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Return outside function")
+        if stmt.value is None:
+            self._expect_type(UNIT, ctx.signature.return_type, stmt.loc)
+        else:
             value_type = self._check_expr(stmt.value, ctx)
-            self._expect_type(value_type, ERROR, stmt.loc)
-            return
-        if isinstance(stmt, ast.ExprStmt):
-            self._check_expr(stmt.value, ctx)
-            return
-        if isinstance(stmt, ast.ImportStmt):
-            return
-        if isinstance(stmt, ast.IfStmt):
-            cond_type = self._check_expr(stmt.condition, ctx)
-            self._expect_type(cond_type, BOOL, stmt.loc)
-            for inner in stmt.then_block.statements:
+            self._expect_type(value_type, ctx.signature.return_type, stmt.loc)
+
+    def _check_raise(self, stmt: ast.RaiseStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        # Special-case exception constructors in throw/raise.
+        if isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, (ast.Name, ast.Attr)):
+            callee_name = self._resolve_callee(stmt.value.func, ctx)
+            exc_info = self.exception_infos.get(callee_name)
+            if exc_info:
+                fields = self._check_exception_constructor(stmt.value, exc_info, ctx, collect=True)
+                stmt.value = ast.ExceptionCtor(
+                    loc=stmt.loc,
+                    name=exc_info.name,
+                    event_code=exc_info.event_code,
+                    fields=fields,
+                    arg_order=exc_info.arg_order.copy(),
+                )
+                return
+            # If it isn't an exception and also not a known callable, report as unknown exception.
+            is_known_callable = self._function_info(callee_name) is not None or callee_name in self.struct_infos
+            if not is_known_callable and isinstance(stmt.value.func, ast.Name):
+                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Unknown exception '{callee_name}'")
+        value_type = self._check_expr(stmt.value, ctx)
+        self._expect_type(value_type, ERROR, stmt.loc)
+
+    def _check_expr_stmt(self, stmt: ast.ExprStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        self._check_expr(stmt.value, ctx)
+
+    def _check_import(self, stmt: ast.ImportStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        return
+
+    def _check_if(self, stmt: ast.IfStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        cond_type = self._check_expr(stmt.condition, ctx)
+        self._expect_type(cond_type, BOOL, stmt.loc)
+        for inner in stmt.then_block.statements:
+            self._check_stmt(inner, ctx)
+        if stmt.else_block:
+            for inner in stmt.else_block.statements:
                 self._check_stmt(inner, ctx)
-            if stmt.else_block:
-                for inner in stmt.else_block.statements:
-                    self._check_stmt(inner, ctx)
-            return
-        if isinstance(stmt, ast.WhileStmt):
-            cond_type = self._check_expr(stmt.condition, ctx)
-            self._expect_type(cond_type, BOOL, stmt.loc)
-            for inner in stmt.body.statements:
-                self._check_stmt(inner, ctx, in_loop=in_loop)
-            return
-        if isinstance(stmt, ast.ForStmt):
-            iter_ty = self._check_expr(stmt.iter_expr, ctx)
-            elem_ty = array_element_type(iter_ty)
-            if elem_ty is None:
-                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: for-loop expects an Array, got {iter_ty}")
-            ctx.scope.define(stmt.var, VarInfo(type=elem_ty, mutable=False), stmt.loc)
-            for inner in stmt.body.statements:
-                self._check_stmt(inner, ctx, in_loop=in_loop)
-            return
-        if isinstance(stmt, ast.TryStmt):
-            for inner in stmt.body.statements:
-                self._check_stmt(inner, ctx, in_loop=in_loop)
-            for clause in stmt.catches:
-                catch_scope = Scope(parent=ctx.scope)
-                binder_name = clause.binder
-                binder_type = ERROR
-                if clause.event:
-                    exc_info = self.exception_infos.get(clause.event)
-                    if exc_info:
-                        binder_type = Type(exc_info.name)
-                catch_ctx = FunctionContext(
-                    name=ctx.name,
-                    signature=ctx.signature,
-                    scope=catch_scope,
-                    allow_returns=ctx.allow_returns,
-                    receiver_placeholder=None,
+
+    def _check_while(self, stmt: ast.WhileStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        cond_type = self._check_expr(stmt.condition, ctx)
+        self._expect_type(cond_type, BOOL, stmt.loc)
+        for inner in stmt.body.statements:
+            self._check_stmt(inner, ctx, in_loop=in_loop)
+
+    def _check_for(self, stmt: ast.ForStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        iter_ty = self._check_expr(stmt.iter_expr, ctx)
+        elem_ty = array_element_type(iter_ty)
+        if elem_ty is None:
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: for-loop expects an Array, got {iter_ty}")
+        ctx.scope.define(stmt.var, VarInfo(type=elem_ty, mutable=False), stmt.loc)
+        for inner in stmt.body.statements:
+            self._check_stmt(inner, ctx, in_loop=in_loop)
+
+    def _check_try(self, stmt: ast.TryStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        for inner in stmt.body.statements:
+            self._check_stmt(inner, ctx, in_loop=in_loop)
+        for clause in stmt.catches:
+            catch_scope = Scope(parent=ctx.scope)
+            binder_name = clause.binder
+            binder_type = ERROR
+            exc_info = self.exception_infos.get(clause.event) if clause.event else None
+            if exc_info:
+                binder_type = Type(exc_info.name)
+                clause.event_code = exc_info.event_code
+                clause.arg_order = exc_info.arg_order
+            catch_ctx = FunctionContext(
+                name=ctx.name,
+                signature=ctx.signature,
+                scope=catch_scope,
+                allow_returns=ctx.allow_returns,
+                receiver_placeholder=None,
+            )
+            if binder_name:
+                catch_scope.define(
+                    binder_name,
+                    VarInfo(type=binder_type, mutable=False),
+                    stmt.loc,
                 )
-                if binder_name:
-                    catch_scope.define(
-                        binder_name,
-                        VarInfo(type=binder_type, mutable=False),
-                        stmt.loc,
-                    )
-                if clause.event:
-                    exc_info = self.exception_infos.get(clause.event)
-                    if exc_info:
-                        clause.event_code = exc_info.event_code
-                        clause.arg_order = exc_info.arg_order
-                for inner in clause.block.statements:
-                    self._check_stmt(inner, catch_ctx, in_loop=in_loop)
-            return
-        if isinstance(stmt, ast.BreakStmt):
-            if not in_loop:
-                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: 'break' outside loop")
-            return
-        if isinstance(stmt, ast.ContinueStmt):
-            if not in_loop:
-                raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: 'continue' outside loop")
-            return
-        raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: Unsupported statement {stmt}")
+            for inner in clause.block.statements:
+                self._check_stmt(inner, catch_ctx, in_loop=in_loop)
+
+    def _check_break(self, stmt: ast.BreakStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        if not in_loop:
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: 'break' outside loop")
+
+    def _check_continue(self, stmt: ast.ContinueStmt, ctx: FunctionContext, in_loop: bool) -> None:
+        if not in_loop:
+            raise CheckError(f"{stmt.loc.line}:{stmt.loc.column}: 'continue' outside loop")
 
     def _check_expr(self, expr: ast.Expr, ctx: FunctionContext) -> Type:
-        if isinstance(expr, ast.Literal):
-            value = expr.value
-            if isinstance(value, bool):
-                return BOOL
-            if isinstance(value, int):
-                return INT
-            if isinstance(value, float):
-                return F64
-            if isinstance(value, str):
-                return STR
-            raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unsupported literal {value!r}")
-        if isinstance(expr, ast.Name):
-            info = ctx.scope.lookup(expr.ident, expr.loc)
-            return info.type
-        if isinstance(expr, ast.Call):
-            return self._check_call(expr, ctx)
-        if isinstance(expr, ast.ExceptionCtor):
-            # Already type-checked; constructors yield Error.
-            return ERROR
-        if isinstance(expr, ast.Attr):
-            base_type = self._check_expr(expr.value, ctx)
-            return self._resolve_attr_type(base_type, expr)
-        if isinstance(expr, ast.Move):
-            return self._check_expr(expr.value, ctx)
-        if isinstance(expr, ast.ArrayLiteral):
-            return self._check_array_literal(expr, ctx)
-        if isinstance(expr, ast.Index):
-            return self._check_index_expr(expr, ctx)
-        if isinstance(expr, ast.TryCatchExpr):
-            return self._check_try_catch_expr(expr, ctx)
-        if isinstance(expr, ast.Ternary):
-            return self._check_ternary(expr, ctx)
-        if isinstance(expr, ast.Placeholder):
-            if ctx.receiver_placeholder is None:
-                raise CheckError(f"{expr.loc.line}:{expr.loc.column}: '.' placeholder used outside of receiver context")
-            return ctx.receiver_placeholder
-        if isinstance(expr, ast.Unary):
-            operand_type = self._check_expr(expr.operand, ctx)
-            if expr.op == "-":
-                self._expect_number(operand_type, expr.loc)
-                return operand_type
-            if expr.op == "not":
-                self._expect_type(operand_type, BOOL, expr.loc)
-                return BOOL
-            if expr.op in ("&", "&mut"):
-                if not isinstance(expr.operand, ast.Name):
-                    raise CheckError(
-                        f"{expr.loc.line}:{expr.loc.column}: cannot borrow from a temporary or non-lvalue"
-                    )
-                var = ctx.scope.lookup(expr.operand.ident, expr.operand.loc)
-                if expr.op == "&mut" and not var.mutable:
-                    raise CheckError(
-                        f"{expr.loc.line}:{expr.loc.column}: cannot take &mut of immutable binding '{expr.operand.ident}'"
-                    )
-                return ref_of(operand_type, mutable=(expr.op == "&mut"))
-            raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unknown unary operator {expr.op}")
-        if isinstance(expr, ast.Binary):
-            return self._check_binary(expr, ctx)
-        raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unsupported expression {expr}")
+        handler = self._expr_dispatch[expr.KIND]
+        if handler is None:
+            raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unsupported expression {expr}")
+        return handler(expr, ctx)
+
+    def _check_literal(self, expr: ast.Literal, ctx: FunctionContext) -> Type:
+        # Exact-type lookup keeps bool distinct from int without ordered isinstance probes.
+        ty = _LITERAL_TYPES.get(type(expr.value))
+        if ty is None:
+            raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unsupported literal {expr.value!r}")
+        return ty
+
+    def _check_name(self, expr: ast.Name, ctx: FunctionContext) -> Type:
+        info = ctx.scope.lookup(expr.ident, expr.loc)
+        return info.type
+
+    def _check_exception_ctor(self, expr: ast.ExceptionCtor, ctx: FunctionContext) -> Type:
+        # Already type-checked; constructors yield Error.
+        return ERROR
+
+    def _check_attr(self, expr: ast.Attr, ctx: FunctionContext) -> Type:
+        base_type = self._check_expr(expr.value, ctx)
+        return self._resolve_attr_type(base_type, expr)
+
+    def _check_move(self, expr: ast.Move, ctx: FunctionContext) -> Type:
+        return self._check_expr(expr.value, ctx)
+
+    def _check_placeholder(self, expr: ast.Placeholder, ctx: FunctionContext) -> Type:
+        if ctx.receiver_placeholder is None:
+            raise CheckError(f"{expr.loc.line}:{expr.loc.column}: '.' placeholder used outside of receiver context")
+        return ctx.receiver_placeholder
+
+    def _check_unary(self, expr: ast.Unary, ctx: FunctionContext) -> Type:
+        operand_type = self._check_expr(expr.operand, ctx)
+        if expr.op == "-":
+            self._expect_number(operand_type, expr.loc)
+            return operand_type
+        if expr.op == "not":
+            self._expect_type(operand_type, BOOL, expr.loc)
+            return BOOL
+        if expr.op in ("&", "&mut"):
+            if not isinstance(expr.operand, ast.Name):
+                raise CheckError(
+                    f"{expr.loc.line}:{expr.loc.column}: cannot borrow from a temporary or non-lvalue"
+                )
+            var = ctx.scope.lookup(expr.operand.ident, expr.operand.loc)
+            if expr.op == "&mut" and not var.mutable:
+                raise CheckError(
+                    f"{expr.loc.line}:{expr.loc.column}: cannot take &mut of immutable binding '{expr.operand.ident}'"
+                )
+            return ref_of(operand_type, mutable=(expr.op == "&mut"))
+        raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unknown unary operator {expr.op}")
 
     def _check_try_catch_expr(self, expr: ast.TryCatchExpr, ctx: FunctionContext) -> Type:
         attempt_type = self._check_expr(expr.attempt, ctx)
@@ -678,15 +752,12 @@ class Checker:
 
     def _check_call(self, expr: ast.Call, ctx: FunctionContext) -> Type:
         placeholder_prev = ctx.receiver_placeholder
-        base_type_for_placeholder: Optional[Type] = None
         try:
-            if isinstance(expr.func, ast.Attr):
-                base_type_for_placeholder = self._check_expr(expr.func.value, ctx)
-                ctx.receiver_placeholder = base_type_for_placeholder
             # Optional<T> builtin methods are handled specially.
             method_sig: Optional[FunctionSignature] = None
             if isinstance(expr.func, ast.Attr):
-                base_type = base_type_for_placeholder if base_type_for_placeholder is not None else self._check_expr(expr.func.value, ctx)
+                base_type = self._check_expr(expr.func.value, ctx)
+                ctx.receiver_placeholder = base_type
                 if base_type.name == "Optional":
                     return self._check_optional_call(expr, base_type, ctx)
                 if base_type.name == "DiagnosticValue":
@@ -734,13 +805,16 @@ class Checker:
             if struct_info:
                 self._check_struct_constructor(expr, struct_info, ctx)
                 return Type(callee_name)
-            if method_sig is None and callee_name not in self.function_infos:
+            fn_info = self._function_info(callee_name)
+            if method_sig is None and fn_info is None:
                 raise CheckError(f"{expr.loc.line}:{expr.loc.column}: Unknown function '{callee_name}'")
-            sig = method_sig or self.function_infos[callee_name].signature
+            sig = method_sig or fn_info.signature
             expected_params = sig.params[1:] if method_sig else sig.params
-            if len(expr.args) != len(expected_params):
+            args = expr.args
+            arity = len(expected_params)
+            if len(args) != arity:
                 raise CheckError(
-                    f"{expr.loc.line}:{expr.loc.column}: '{callee_name}' expects {len(expected_params)} args, got {len(expr.args)}"
+                    f"{expr.loc.line}:{expr.loc.column}: '{callee_name}' expects {arity} args, got {len(args)}"
                 )
             for kw in expr.kwargs:
                 if kw.name not in sig.allowed_kwargs:
@@ -748,7 +822,11 @@ class Checker:
                         f"{kw.value.loc.line}:{kw.value.loc.column}: '{callee_name}' does not accept keyword '{kw.name}'"
                     )
                 self._check_expr(kw.value, ctx)
-            for arg_expr, expected in zip(expr.args, expected_params):
+            check_expr = self._check_expr
+            expect_type = self._expect_type
+            for i in range(arity):
+                arg_expr = args[i]
+                expected = expected_params[i]
                 if isinstance(expected, ReferenceType):
                     # Auto-borrow from lvalues only.
                     if isinstance(arg_expr, ast.Unary) and arg_expr.op in ("&", "&mut"):
@@ -780,8 +858,7 @@ class Checker:
                             f"{arg_expr.loc.line}:{arg_expr.loc.column}: cannot borrow from a temporary or moved value"
                         )
                 else:
-                    actual = self._check_expr(arg_expr, ctx)
-                    self._expect_type(actual, expected, arg_expr.loc)
+                    expect_type(check_expr(arg_expr, ctx), expected, arg_expr.loc)
             return sig.return_type
         finally:
             ctx.receiver_placeholder = placeholder_prev
@@ -791,11 +868,11 @@ class Checker:
             raise CheckError(
                 f"{expr.loc.line}:{expr.loc.column}: '{info.name}' expects {len(info.field_order)} args, got {len(expr.args)}"
             )
-        used = []
+        used: Set[str] = set()
         for arg_expr, field_name in zip(expr.args, info.field_order):
             actual = self._check_expr(arg_expr, ctx)
             self._expect_type(actual, info.field_types[field_name], arg_expr.loc)
-            used.append(field_name)
+            used.add(field_name)
         for kw in expr.kwargs:
             if kw.name not in info.field_types:
                 raise CheckError(
@@ -807,7 +884,7 @@ class Checker:
                 )
             actual = self._check_expr(kw.value, ctx)
             self._expect_type(actual, info.field_types[kw.name], kw.value.loc)
-            used.append(kw.name)
+            used.add(kw.name)
         missing = [name for name in info.field_order if name not in used]
         if missing:
             raise CheckError(
@@ -817,7 +894,7 @@ class Checker:
     def _check_exception_constructor(
         self, expr: ast.Call, info: ExceptionInfo, ctx: FunctionContext, collect: bool = False
     ) -> Dict[str, ast.Expr] | None:
-        used: List[str] = []
+        used: Set[str] = set()
         fields: Dict[str, ast.Expr] = {}
         if len(expr.args) > len(info.arg_order):
             raise CheckError(
@@ -826,7 +903,7 @@ class Checker:
         for arg_expr, arg_name in zip(expr.args, info.arg_order):
             actual = self._check_expr(arg_expr, ctx)
             self._expect_type(actual, info.arg_types[arg_name], arg_expr.loc)
-            used.append(arg_name)
+            used.add(arg_name)
             fields[arg_name] = arg_expr
         for kw in expr.kwargs:
             if kw.name == "domain":
@@ -844,7 +921,7 @@ class Checker:
                 )
             actual = self._check_expr(kw.value, ctx)
             self._expect_type(actual, info.arg_types[kw.name], kw.value.loc)
-            used.append(kw.name)
+            used.add(kw.name)
             fields[kw.name] = kw.value
         missing = [name for name in info.arg_order if name not in used]
         if missing:
@@ -854,12 +931,19 @@ class Checker:
         return fields if collect else None
 
     def _check_binary(self, expr: ast.Binary, ctx: FunctionContext) -> Type:
-        left = self._check_expr(expr.left, ctx)
-        right = self._check_expr(expr.right, ctx)
-        def _base_numeric(t: Type) -> Type:
-            if isinstance(t, ReferenceType):
-                return t.args[0]
-            return t
+        # Fold left-nested chains (a + b + c ...) with a loop instead of one frame per operator.
+        chain: List[ast.Binary] = []
+        node: ast.Expr = expr
+        while type(node) is ast.Binary:
+            chain.append(node)
+            node = node.left
+        left = self._check_expr(node, ctx)
+        for node in reversed(chain):
+            right = self._check_expr(node.right, ctx)
+            left = self._binary_result(node, left, right)
+        return left
+
+    def _binary_result(self, expr: ast.Binary, left: Type, right: Type) -> Type:
         lnum = _base_numeric(left)
         rnum = _base_numeric(right)
         op = expr.op
@@ -968,12 +1052,17 @@ class Checker:
             raise CheckError(f"{loc.line}:{loc.column}: Expected numeric type, got {actual}")
 
     def _expect_type(self, actual: Type, expected: Type, loc: ast.Located) -> None:
-        if expected == DISPLAYABLE:
+        # DISPLAYABLE is a sentinel that is never rebuilt, so identity suffices.
+        if expected is DISPLAYABLE:
             if not is_displayable(actual):
                 raise CheckError(
                     f"{loc.line}:{loc.column}: Expected type implementing Display, got {actual}"
                 )
             return
+        # Builtin types are shared singletons; skip the structural compare when
+        # both sides are the same object.
+        if actual is expected:
+            return
         # Allow auto-deref of references when the inner type matches.
         if isinstance(actual, ReferenceType) and actual.args and actual.args[0] == expected:
             return
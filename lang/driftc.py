@@ -55,13 +55,13 @@ def _annotate_can_error(funcs: list[mir.Function]) -> None:
 def _dump_ssa(fn_name: str, blocks: dict[str, mir.BasicBlock], file=None) -> None:
     if file is None:
         file = sys.stderr
-    print(f"== SSA for {fn_name} ==", file=file)
+    lines = [f"== SSA for {fn_name} =="]
     for name, block in blocks.items():
         params = ", ".join(f"{p.name}:{p.type}" for p in block.params)
-        print(f"block {name}({params})", file=file)
-        for instr in block.instructions:
-            print(f"  {instr}", file=file)
-        print(f"  term {block.terminator}", file=file)
+        lines.append(f"block {name}({params})")
+        lines.extend(f"  {instr}" for instr in block.instructions)
+        lines.append(f"  term {block.terminator}")
+    print("\n".join(lines), file=file)
 
 
 def _run_ssa_check(checked: checker.CheckedProgram, simplify: bool, dump: bool) -> None:
@@ -105,7 +105,9 @@ def compile_file(
     ssa_simplify: bool,
     dump_ssa: bool,
 ) -> int:
-    source = source_path.read_text()
+    # Decode in one pass; the grammar accepts both \n and \r\n line endings,
+    # so the text-mode newline translation layer is unnecessary.
+    source = source_path.read_bytes().decode("utf-8")
     prog = parser.parse_program(source)
     checked = checker.Checker(builtin_signatures()).check(prog)
     if ssa_check:
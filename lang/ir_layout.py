@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List
 
 from .types import Type
@@ -12,6 +13,7 @@ class StructLayout:
     field_names: List[str]
     field_types: List[Type]
 
-    @property
+    @cached_property
     def index_by_name(self) -> dict[str, int]:
+        # Built once per layout; codegen probes it for every field access.
         return {n: i for i, n in enumerate(self.field_names)}
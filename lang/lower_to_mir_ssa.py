@@ -91,41 +91,90 @@ def lower_block_in_env(
 ) -> Tuple[mir.BasicBlock, SSAEnv]:
     """Lower a sequence of statements under a given SSA env (scaffold)."""
     for stmt in stmts:
-        if isinstance(stmt, ast.LetStmt):
-            current, env = lower_let(stmt, env, current, checked, blocks, fresh_block)
-        elif isinstance(stmt, ast.AssignStmt):
-            current, env = lower_assign(stmt, env, current, checked, blocks, fresh_block)
-        elif isinstance(stmt, ast.IfStmt):
-            current, env = lower_if(stmt, env, blocks, current, checked, fresh_block)
-        elif isinstance(stmt, ast.ReturnStmt):
-            # Scaffold: return without building pair ABI; assumes expression lowered elsewhere.
-            if stmt.value is None:
-                current.terminator = mir.Return()
-            else:
-                val_ssa, _, current, env = lower_expr_to_ssa(
-                    stmt.value, env, current, checked, blocks, fresh_block
-                )
-                current.terminator = mir.Return(value=val_ssa)
-            return current, env
-        elif isinstance(stmt, ast.WhileStmt):
-            current, env = lower_while(stmt, env, blocks, current, checked, fresh_block)
-        elif isinstance(stmt, ast.ExprStmt):
-            _, _, current, env = lower_expr_to_ssa(stmt.value, env, current, checked, blocks, fresh_block)
-        elif isinstance(stmt, ast.TryStmt):
-            current, env = lower_try_stmt(stmt, env, blocks, current, checked, fresh_block)
-        elif isinstance(stmt, ast.ThrowStmt):
-            err_ssa, _, current, env = lower_expr_to_ssa(stmt.expr, env, current, checked, blocks, fresh_block)
-            current.terminator = mir.Throw(error=err_ssa, loc=stmt.loc)
-            return current, env
-        elif isinstance(stmt, ast.RaiseStmt):
-            err_ssa, _, current, env = lower_expr_to_ssa(stmt.value, env, current, checked, blocks, fresh_block)
-            current.terminator = mir.Throw(error=err_ssa, loc=stmt.loc)
+        lower = _STMT_LOWERERS[stmt.KIND]
+        if lower is None:
+            # Other statements (break/continue/import) to be filled in later.
+            continue
+        current, env = lower(stmt, env, blocks, current, checked, fresh_block)
+        if stmt.KIND in _BLOCK_ENDING_KINDS:
             return current, env
-        elif isinstance(stmt, ast.ForStmt):
-            current, env = lower_for(stmt, env, blocks, current, checked, fresh_block)
-        else:
-            # Other statements (if/while/try) to be filled in later.
-            pass
+    return current, env
+
+
+def _lower_let_stmt(
+    stmt: ast.LetStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    return lower_let(stmt, env, current, checked, blocks, fresh_block)
+
+
+def _lower_assign_stmt(
+    stmt: ast.AssignStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    return lower_assign(stmt, env, current, checked, blocks, fresh_block)
+
+
+def _lower_return_stmt(
+    stmt: ast.ReturnStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    # Scaffold: return without building pair ABI; assumes expression lowered elsewhere.
+    if stmt.value is None:
+        current.terminator = mir.Return()
+    else:
+        val_ssa, _, current, env = lower_expr_to_ssa(stmt.value, env, current, checked, blocks, fresh_block)
+        current.terminator = mir.Return(value=val_ssa)
+    return current, env
+
+
+def _lower_expr_stmt(
+    stmt: ast.ExprStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    _, _, current, env = lower_expr_to_ssa(stmt.value, env, current, checked, blocks, fresh_block)
+    return current, env
+
+
+def _lower_throw_stmt(
+    stmt: ast.ThrowStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    err_ssa, _, current, env = lower_expr_to_ssa(stmt.expr, env, current, checked, blocks, fresh_block)
+    current.terminator = mir.Throw(error=err_ssa, loc=stmt.loc)
+    return current, env
+
+
+def _lower_raise_stmt(
+    stmt: ast.RaiseStmt,
+    env: SSAEnv,
+    blocks: Dict[str, mir.BasicBlock],
+    current: mir.BasicBlock,
+    checked: CheckedProgram,
+    fresh_block: callable,
+) -> Tuple[mir.BasicBlock, SSAEnv]:
+    err_ssa, _, current, env = lower_expr_to_ssa(stmt.value, env, current, checked, blocks, fresh_block)
+    current.terminator = mir.Throw(error=err_ssa, loc=stmt.loc)
     return current, env
 
 
@@ -413,13 +462,14 @@ def lower_while(
         stmt.condition, header_env, header_block, checked, blocks, fresh_block
     )
 
-    # Prepare body env starting from header env
-    body_env = header_env.clone_for_block({u: header_env.lookup_user(u) for u in live_users})
+    # Prepare body env starting from header env; the same live values feed the exit edge.
+    header_vals = [header_env.lookup_user(u) for u in live_users]
+    body_env = header_env.clone_for_block(dict(zip(live_users, header_vals)))
 
     header_block.terminator = mir.CondBr(
         cond=cond_ssa,
         then=mir.Edge(target=body_name, args=[]),
-        els=mir.Edge(target=after_name, args=[header_env.lookup_user(u) for u in live_users]),
+        els=mir.Edge(target=after_name, args=header_vals),
     )
 
     # Lower body
@@ -1420,3 +1470,25 @@ def lower_try_stmt(
         if placeholder_ssa is None or placeholder_ty is None:
             raise LoweringError("receiver placeholder used outside of method call")
         return placeholder_ssa, placeholder_ty, current, env
+
+
+# Statement lowering table indexed by ast.Stmt.KIND; every entry takes
+# (stmt, env, blocks, current, checked, fresh_block) and returns (current, env).
+_STMT_LOWERERS: List[Optional[callable]] = [None] * ast.STMT_KIND_COUNT
+for _stmt_cls, _lower in (
+    (ast.LetStmt, _lower_let_stmt),
+    (ast.AssignStmt, _lower_assign_stmt),
+    (ast.IfStmt, lower_if),
+    (ast.ReturnStmt, _lower_return_stmt),
+    (ast.WhileStmt, lower_while),
+    (ast.ExprStmt, _lower_expr_stmt),
+    (ast.TryStmt, lower_try_stmt),
+    (ast.ThrowStmt, _lower_throw_stmt),
+    (ast.RaiseStmt, _lower_raise_stmt),
+    (ast.ForStmt, lower_for),
+):
+    _STMT_LOWERERS[_stmt_cls.KIND] = _lower
+del _stmt_cls, _lower
+
+# Statements that terminate the current block; lowering of the rest of the list stops there.
+_BLOCK_ENDING_KINDS = frozenset({ast.ReturnStmt.KIND, ast.ThrowStmt.KIND, ast.RaiseStmt.KIND})
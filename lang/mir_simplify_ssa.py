@@ -8,6 +8,7 @@ Limited scope:
 
 from __future__ import annotations
 
+import operator
 from typing import Dict, Set
 
 from . import mir
@@ -17,30 +18,31 @@ from .types import BOOL, INT, Type
 _INT_BIN_OPS = {"+", "-", "*", "/", "==", "!=", "<", "<=", ">", ">="}
 
 
+def _fold_div(lhs_val, rhs_val):
+    return lhs_val // rhs_val if rhs_val != 0 else None
+
+
+_FOLDERS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _fold_div,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
 def _fold_binary(op: str, lhs_val, rhs_val):
     if not isinstance(lhs_val, (int, bool)) or not isinstance(rhs_val, (int, bool)):
         return None
-    if op == "+":
-        return lhs_val + rhs_val
-    if op == "-":
-        return lhs_val - rhs_val
-    if op == "*":
-        return lhs_val * rhs_val
-    if op == "/":
-        return lhs_val // rhs_val if rhs_val != 0 else None
-    if op == "==":
-        return lhs_val == rhs_val
-    if op == "!=":
-        return lhs_val != rhs_val
-    if op == "<":
-        return lhs_val < rhs_val
-    if op == "<=":
-        return lhs_val <= rhs_val
-    if op == ">":
-        return lhs_val > rhs_val
-    if op == ">=":
-        return lhs_val >= rhs_val
-    return None
+    fold = _FOLDERS.get(op)
+    if fold is None:
+        return None
+    return fold(lhs_val, rhs_val)
 
 
 def simplify_function(fn: mir.Function) -> mir.Function:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from . import mir
 from .types import ERROR, array_of, Type
@@ -15,30 +18,85 @@ class VerificationError(Exception):
         return self.message
 
 
-class State:
+class NameBits:
+    """Per-function interning of MIR value names to single-bit masks.
+
+    Def/move/drop sets are int bitmasks over these bits, so unions are one
+    `|` and membership is one `&` instead of hashing into a set of strings.
+    """
+
+    __slots__ = ("_bits",)
+
     def __init__(self) -> None:
-        self.defined: Set[str] = set()
-        self.moved: Set[str] = set()
-        self.dropped: Set[str] = set()
+        self._bits: Dict[str, int] = {}
+
+    def bit(self, name: str) -> int:
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self._bits[name] = 1 << len(self._bits)
+        return bit
+
+    def mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+
+@dataclass(slots=True)
+class EdgeTable:
+    """Incoming edges stored as parallel arrays.
+
+    `sources[i]` and `args[i]` describe edge `i`; `per_target[b]` lists the
+    indices of the edges into block `b`, in block order.
+    """
+
+    sources: List[str]
+    args: List[List[str]]
+    per_target: Dict[str, List[int]]
+
+
+class State:
+    __slots__ = ("names", "defined", "moved", "dropped", "live", "types")
+
+    def __init__(self, names: NameBits) -> None:
+        self.names = names
+        self.defined = 0
+        self.moved = 0
+        self.dropped = 0
+        # defined & ~moved & ~dropped, kept incrementally so a valid operand is one bit test.
+        self.live = 0
         self.types: Dict[str, Type] = {}
 
+    def seed(self, defined: int) -> None:
+        self.defined = self.live = defined
+
     def define(self, name: str) -> None:
-        self.defined.add(name)
+        self.define_bit(self.names.bit(name))
+
+    def define_bit(self, bit: int) -> None:
+        self.defined |= bit
+        if not (self.moved | self.dropped) & bit:
+            self.live |= bit
 
     def is_defined(self, name: str) -> bool:
-        return name in self.defined
+        return bool(self.defined & self.names.bit(name))
 
     def move(self, name: str) -> None:
-        self.moved.add(name)
+        bit = self.names.bit(name)
+        self.moved |= bit
+        self.live &= ~bit
 
     def is_moved(self, name: str) -> bool:
-        return name in self.moved
+        return bool(self.moved & self.names.bit(name))
 
     def drop(self, name: str) -> None:
-        self.dropped.add(name)
+        bit = self.names.bit(name)
+        self.dropped |= bit
+        self.live &= ~bit
 
     def is_dropped(self, name: str) -> bool:
-        return name in self.dropped
+        return bool(self.dropped & self.names.bit(name))
 
     def set_type(self, name: str, typ: Type) -> None:
         self.types[name] = typ
@@ -55,7 +113,52 @@ def _call_terminator(block: mir.BasicBlock) -> Optional[mir.Call]:
     return None
 
 
-def verify_program(program: mir.Program) -> None:
+# Programs with at least this many functions may be verified across processes.
+_PARALLEL_MIN_FUNCTIONS = 8
+
+_worker_program: mir.Program | None = None
+
+
+def _init_worker(program: mir.Program) -> None:
+    global _worker_program
+    _worker_program = program
+
+
+def _verify_in_worker(fn_name: str) -> str | None:
+    assert _worker_program is not None
+    try:
+        verify_function(_worker_program.functions[fn_name], _worker_program)
+    except VerificationError as exc:
+        return exc.message
+    return None
+
+
+def _env_workers() -> int:
+    """LANG_VERIFY_WORKERS as an int; unset or malformed values mean sequential."""
+    try:
+        return int(os.environ.get("LANG_VERIFY_WORKERS", "0") or 0)
+    except ValueError:
+        return 0
+
+
+def verify_program(program: mir.Program, workers: int | None = None) -> None:
+    """Verify every function; functions are independent, so large programs can fan out.
+
+    `workers` (default: the LANG_VERIFY_WORKERS environment variable, else 0)
+    above 1 verifies programs of `_PARALLEL_MIN_FUNCTIONS` or more functions in
+    a process pool. The first failing function in program order is reported,
+    exactly as in the sequential path.
+    """
+    if workers is None:
+        workers = _env_workers()
+    if workers > 1 and len(program.functions) >= _PARALLEL_MIN_FUNCTIONS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(program,)) as pool:
+            for message in pool.map(_verify_in_worker, program.functions, chunksize=4):
+                if message is not None:
+                    # Drop the queued functions so the pool's exit only waits for in-flight ones.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise VerificationError(message)
+        return
     for fn in program.functions.values():
         verify_function(fn, program)
 
@@ -76,352 +179,396 @@ def verify_function(fn: mir.Function, program: mir.Program | None = None) -> Non
         for instr in block.instructions:
             if isinstance(instr, (mir.Const, mir.Move, mir.Copy, mir.Call, mir.CallWithCtx, mir.StructInit, mir.FieldGet, mir.ArrayInit, mir.ArrayLiteral, mir.ArrayGet, mir.Unary, mir.Binary, mir.ConsoleWrite, mir.ConsoleWriteln)):
                 def_blocks.setdefault(getattr(instr, "dest", None), set()).add(name) if getattr(instr, "dest", None) else None
-    in_state, out_state = _dataflow_defs_types(fn, program)
-    incoming = _compute_incoming_args(fn, out_state)
-    _verify_cfg(fn, out_state, incoming)
-    dominators = _compute_dominators(fn)
+    names = NameBits()
+    if len(fn.blocks) == 1:
+        block = fn.blocks[fn.entry]
+        if isinstance(block.terminator, (mir.Return, mir.Raise)) and not _block_edges(block):
+            # Straight-line function: with no edges the CFG walk and incoming-arg
+            # checks cannot fail, and the entry block only dominates itself.
+            cfg = ({fn.entry: []}, {fn.entry: []})
+            in_state, out_state = _dataflow_defs_types(fn, program, names, cfg)
+            _verify_block(fn, block, program, None, in_state, out_state, {fn.entry: {fn.entry}}, def_blocks, names=names)
+            return
+    cfg = _build_cfg(fn)
+    rpo = _reverse_postorder(fn, cfg[0])
+    in_state, out_state = _dataflow_defs_types(fn, program, names, cfg, rpo)
+    incoming = _compute_incoming_args(fn, out_state, cfg)
+    _verify_cfg(fn, out_state, incoming, names)
+    dominators = _compute_dominators(fn, rpo[0])
     for block in fn.blocks.values():
-        _verify_block(fn, block, program, incoming, in_state, out_state, dominators, def_blocks)
+        _verify_block(fn, block, program, incoming, in_state, out_state, dominators, def_blocks, names=names)
+
+
+def _block_edges(block: mir.BasicBlock) -> List[mir.Edge]:
+    """Outgoing edges: branch terminator edges, then call normal/error edges in instruction order."""
+    term = block.terminator
+    edges: List[mir.Edge] = []
+    if isinstance(term, mir.Br):
+        edges.append(term.target)
+    elif isinstance(term, mir.CondBr):
+        edges.append(term.then)
+        edges.append(term.els)
+    for instr in block.instructions:
+        if isinstance(instr, mir.Call):
+            if instr.normal:
+                edges.append(instr.normal)
+            if instr.error:
+                edges.append(instr.error)
+    return edges
+
+
+def _build_cfg(fn: mir.Function) -> Tuple[Dict[str, List[mir.Edge]], Dict[str, List[str]]]:
+    """Per-block outgoing edges and, per target, one predecessor entry per incoming edge (in block order)."""
+    succ_edges: Dict[str, List[mir.Edge]] = {}
+    preds: Dict[str, List[str]] = {name: [] for name in fn.blocks}
+    for name, block in fn.blocks.items():
+        edges = succ_edges[name] = _block_edges(block)
+        for edge in edges:
+            if edge.target in preds:
+                preds[edge.target].append(name)
+    return succ_edges, preds
 
 
 def _compute_incoming_args(
-    fn: mir.Function, out_state: Dict[str, Tuple[Set[str], Dict[str, Type]]]
-) -> Dict[str, List[tuple[List[str], List[Type]]]]:
-    incoming: Dict[str, List[tuple[List[str], List[Type]]]] = {name: [] for name in fn.blocks}
-    for source_name, block in fn.blocks.items():
-        term = block.terminator
-        if isinstance(term, mir.Br):
-            args = term.target.args
-            arg_types = [out_state.get(source_name, (set(), {}))[1].get(arg) for arg in args]
-            if term.target.target in incoming:
-                incoming[term.target.target].append((args, arg_types))
-        elif isinstance(term, mir.CondBr):
-            args_then = term.then.args
-            arg_types_then = [out_state.get(source_name, (set(), {}))[1].get(arg) for arg in args_then]
-            if term.then.target in incoming:
-                incoming[term.then.target].append((args_then, arg_types_then))
-            args_else = term.els.args
-            arg_types_else = [out_state.get(source_name, (set(), {}))[1].get(arg) for arg in args_else]
-            if term.els.target in incoming:
-                incoming[term.els.target].append((args_else, arg_types_else))
-        # call edges as terminators
-        for instr in block.instructions:
-            if isinstance(instr, mir.Call) and (instr.normal or instr.error):
-                if instr.normal:
-                    args = instr.normal.args
-                    arg_types = [out_state.get(source_name, (set(), {}))[1].get(arg) for arg in args]
-                    if instr.normal.target in incoming:
-                        incoming[instr.normal.target].append((args, arg_types))
-                if instr.error:
-                    args = instr.error.args
-                    arg_types = [out_state.get(source_name, (set(), {}))[1].get(arg) for arg in args]
-                    if instr.error.target in incoming:
-                        incoming[instr.error.target].append((args, arg_types))
-    return incoming
+    fn: mir.Function,
+    out_state: Dict[str, Tuple[int, Dict[str, Type]]],
+    cfg: Tuple[Dict[str, List[mir.Edge]], Dict[str, List[str]]] | None = None,
+) -> EdgeTable:
+    """The (source block, edge args) of every incoming edge, indexed per target block.
+
+    Arg types are not materialized here; the consumer reads them from the
+    source's out types only for the args it actually compares.
+    """
+    succ_edges = (cfg or _build_cfg(fn))[0]
+    table = EdgeTable(sources=[], args=[], per_target={name: [] for name in fn.blocks})
+    per_target = table.per_target
+    for source_name, edges in succ_edges.items():
+        for edge in edges:
+            if edge.target in per_target:
+                per_target[edge.target].append(len(table.sources))
+                table.sources.append(source_name)
+                table.args.append(edge.args)
+    return table
+
+
+def _reverse_postorder(fn: mir.Function, succ_edges: Dict[str, List[mir.Edge]]) -> Tuple[List[str], bool]:
+    """Blocks in reverse postorder of a DFS from the entry (then any unreached blocks), and whether the CFG is acyclic.
+
+    An edge to a block still on the DFS stack is a back edge; without one the
+    order is topological.
+    """
+    blocks = fn.blocks
+    roots = [fn.entry, *(name for name in blocks if name != fn.entry)] if fn.entry in blocks else list(blocks)
+    on_stack: Set[str] = set()
+    done: Set[str] = set()
+    postorder: List[str] = []
+    acyclic = True
+    for root in roots:
+        if root in done:
+            continue
+        on_stack.add(root)
+        stack = [(root, iter(succ_edges[root]))]
+        while stack:
+            name, edges = stack[-1]
+            for edge in edges:
+                succ = edge.target
+                if succ not in blocks or succ in done:
+                    continue
+                if succ in on_stack:
+                    acyclic = False
+                    continue
+                on_stack.add(succ)
+                stack.append((succ, iter(succ_edges[succ])))
+                break
+            else:
+                stack.pop()
+                on_stack.discard(name)
+                done.add(name)
+                postorder.append(name)
+    postorder.reverse()
+    return postorder, acyclic
 
 
 def _dataflow_defs_types(
     fn: mir.Function,
     program: mir.Program | None = None,
-) -> tuple[Dict[str, Tuple[Set[str], Dict[str, Type]]], Dict[str, Tuple[Set[str], Dict[str, Type]]]]:
-    in_state: Dict[str, Tuple[Set[str], Dict[str, Type]]] = {}
-    out_state: Dict[str, Tuple[Set[str], Dict[str, Type]]] = {}
-    worklist: List[str] = list(fn.blocks.keys())
+    names: NameBits | None = None,
+    cfg: Tuple[Dict[str, List[mir.Edge]], Dict[str, List[str]]] | None = None,
+    rpo: Tuple[List[str], bool] | None = None,
+) -> tuple[Dict[str, Tuple[int, Dict[str, Type]]], Dict[str, Tuple[int, Dict[str, Type]]]]:
+    """Fixed-point defs (as `names` bitmasks) and value types at block entry and exit.
+
+    `rpo` is `_reverse_postorder`'s result, computed here if not supplied.
+    """
+    if names is None:
+        names = NameBits()
+    succ_edges, preds = cfg or _build_cfg(fn)
+    bit = names.bit
+    out_state: Dict[str, Tuple[int, Dict[str, Type]]] = {}
+    param_defs: Dict[str, int] = {}
+    # Each block's own effect, summarized once so worklist revisits skip the
+    # per-instruction dispatch: the defs it adds, and its dest-type writes in
+    # order as (dest, type, None) or, for moves/copies, (dest, None, source).
+    summaries: Dict[str, Tuple[int, List[Tuple[str, Type | None, str | None]]]] = {}
     for name, block in fn.blocks.items():
-        in_state[name] = (set(p.name for p in block.params), {p.name: p.type for p in block.params})
-        out_state[name] = (set(), {})
+        param_defs[name] = names.mask(p.name for p in block.params)
+        out_state[name] = (0, {})
+        summaries[name] = _summarize_block(block, program, bit)
+
+    def merge_preds(name: str, block: mir.BasicBlock) -> Tuple[int, Dict[str, Type], bool]:
+        """Entry defs/types and whether the type dict is freshly built (safe to mutate).
+
+        With no params and a single predecessor the predecessor's out types are
+        shared as-is; out-state type dicts are never mutated once stored.
+        """
+        merged_defs = param_defs[name]
+        block_preds = preds[name]
+        if not block.params and block_preds and all(p == block_preds[0] for p in block_preds):
+            pred_out_defs, pred_out_types = out_state[block_preds[0]]
+            return merged_defs | pred_out_defs, pred_out_types, False
+        merged_types: Dict[str, Type] = {p.name: p.type for p in block.params}
+        for pred_name in block_preds:
+            pred_out_defs, pred_out_types = out_state[pred_name]
+            merged_defs |= pred_out_defs
+            merged_types.update(pred_out_types)
+        return merged_defs, merged_types, True
+
+    def transfer(name: str) -> bool:
+        """Recompute `name`'s out facts from its predecessors; True if they changed."""
+        block = fn.blocks[name]
+        gen, type_ops = summaries[name]
+        cur_defs, cur_types, owned = merge_preds(name, block)
+        cur_defs |= gen
+        if type_ops:
+            if not owned:
+                cur_types = dict(cur_types)
+            for dest, ty, source in type_ops:
+                if source is not None:
+                    ty = cur_types.get(source)
+                    if not ty:
+                        continue
+                cur_types[dest] = ty
+        if out_state[name] == (cur_defs, cur_types):
+            return False
+        out_state[name] = (cur_defs, cur_types)
+        return True
+
+    order, acyclic = rpo or _reverse_postorder(fn, succ_edges)
+    if acyclic:
+        # Topological order: every predecessor's out facts are final before a
+        # block is visited, so one pass reaches the fixed point.
+        for name in order:
+            transfer(name)
+    else:
+        # Only out facts are carried between visits; entry facts are re-derived from them.
+        # Every block is visited once in reverse postorder, then only successors
+        # of blocks whose out facts changed.
+        worklist = deque(order)
+        queued = set(worklist)
+        while worklist:
+            name = worklist.popleft()
+            queued.discard(name)
+            if transfer(name):
+                for edge in succ_edges[name]:
+                    succ = edge.target
+                    if succ in out_state and succ not in queued:
+                        queued.add(succ)
+                        worklist.append(succ)
+    in_state = {name: merge_preds(name, block)[:2] for name, block in fn.blocks.items()}
+    return in_state, out_state
 
-    changed = True
-    while changed:
-        changed = False
-        for name, block in fn.blocks.items():
-            # merge predecessors into in_state
-            merged_defs: Set[str] = set(p.name for p in block.params)
-            merged_types: Dict[str, Type] = {p.name: p.type for p in block.params}
-            for pred_name, pred_block in fn.blocks.items():
-                term = pred_block.terminator
-                edges: List[mir.Edge] = []
-                if isinstance(term, mir.Br):
-                    edges = [term.target]
-                elif isinstance(term, mir.CondBr):
-                    edges = [term.then, term.els]
-                for instr in pred_block.instructions:
-                    if isinstance(instr, mir.Call) and instr.normal:
-                        edges.append(instr.normal)
-                    if isinstance(instr, mir.Call) and instr.error:
-                        edges.append(instr.error)
-                for edge in edges:
-                    if edge.target == name:
-                        pred_out_defs, pred_out_types = out_state.get(pred_name, (set(), {}))
-                        merged_defs.update(pred_out_defs)
-                        if isinstance(pred_out_types, dict):
-                            merged_types.update(pred_out_types)
-            if (merged_defs, merged_types) != in_state[name]:
-                in_state[name] = (merged_defs, merged_types)
-                changed = True
 
-            in_defs, in_types = in_state[name]
-            cur_defs = set(in_defs)
-            cur_types = dict(in_types)
-            for instr in block.instructions:
-                if isinstance(instr, mir.Const):
-                    cur_defs.add(instr.dest)
-                    cur_types[instr.dest] = instr.type
-                elif isinstance(instr, (mir.Move, mir.Copy)):
-                    cur_defs.add(instr.dest)
-                    src_ty = cur_types.get(instr.source)
-                    if src_ty:
-                        cur_types[instr.dest] = src_ty
-                elif isinstance(instr, (mir.Call, mir.CallWithCtx)):
-                    cur_defs.add(instr.dest)
-                    if program and instr.callee in program.functions:
-                        cur_types[instr.dest] = program.functions[instr.callee].return_type
-                    if instr.err_dest:
-                        cur_defs.add(instr.err_dest)
-                        cur_types[instr.err_dest] = ERROR
-                elif isinstance(instr, mir.StructInit):
-                    cur_defs.add(instr.dest)
-                    cur_types[instr.dest] = instr.type
-                elif isinstance(instr, mir.FieldGet):
-                    cur_defs.add(instr.dest)
-                elif isinstance(instr, mir.ArrayInit):
-                    cur_defs.add(instr.dest)
-                    cur_types[instr.dest] = array_of(instr.element_type)
-                elif isinstance(instr, mir.ArrayLiteral):
-                    cur_defs.add(instr.dest)
-                    cur_types[instr.dest] = array_of(instr.elem_type)
-                elif isinstance(instr, mir.ArrayGet):
-                    cur_defs.add(instr.dest)
-                elif isinstance(instr, mir.Unary):
-                    cur_defs.add(instr.dest)
-                elif isinstance(instr, mir.Binary):
-                    cur_defs.add(instr.dest)
-                # ArraySet/Drop produce no new defs
-            if out_state[name] != (cur_defs, cur_types):
-                out_state[name] = (cur_defs, cur_types)
-                changed = True
-            # propagate to successors
-            succs: List[str] = []
-            term = block.terminator
-            if isinstance(term, mir.Br):
-                succs = [term.target.target]
-            elif isinstance(term, mir.CondBr):
-                succs = [term.then.target, term.els.target]
-            for instr in block.instructions:
-                if isinstance(instr, mir.Call) and instr.normal:
-                    succs.append(instr.normal.target)
-                if isinstance(instr, mir.Call) and instr.error:
-                    succs.append(instr.error.target)
-            for succ in succs:
-                if succ not in worklist:
-                    worklist.append(succ)
-    return in_state, out_state
+def _summarize_block(
+    block: mir.BasicBlock,
+    program: mir.Program | None,
+    bit: Callable[[str], int],
+) -> Tuple[int, List[Tuple[str, Type | None, str | None]]]:
+    """Defs mask and ordered dest-type writes of a block's instructions, independent of its entry facts."""
+    gen = 0
+    type_ops: List[Tuple[str, Type | None, str | None]] = []
+    for instr in block.instructions:
+        if isinstance(instr, mir.Const):
+            gen |= bit(instr.dest)
+            type_ops.append((instr.dest, instr.type, None))
+        elif isinstance(instr, (mir.Move, mir.Copy)):
+            gen |= bit(instr.dest)
+            type_ops.append((instr.dest, None, instr.source))
+        elif isinstance(instr, (mir.Call, mir.CallWithCtx)):
+            gen |= bit(instr.dest)
+            if program and instr.callee in program.functions:
+                type_ops.append((instr.dest, program.functions[instr.callee].return_type, None))
+            if instr.err_dest:
+                gen |= bit(instr.err_dest)
+                type_ops.append((instr.err_dest, ERROR, None))
+        elif isinstance(instr, mir.StructInit):
+            gen |= bit(instr.dest)
+            type_ops.append((instr.dest, instr.type, None))
+        elif isinstance(instr, mir.ArrayInit):
+            gen |= bit(instr.dest)
+            type_ops.append((instr.dest, array_of(instr.element_type), None))
+        elif isinstance(instr, mir.ArrayLiteral):
+            gen |= bit(instr.dest)
+            type_ops.append((instr.dest, array_of(instr.elem_type), None))
+        elif isinstance(instr, (mir.FieldGet, mir.ArrayGet, mir.Unary, mir.Binary)):
+            gen |= bit(instr.dest)
+        # ArraySet/Drop produce no new defs
+    return gen, type_ops
 
 
 def _verify_cfg(
     fn: mir.Function,
-    out_state: Dict[str, Tuple[Set[str], Dict[str, Type]]],
-    incoming: Dict[str, List[tuple[List[str], List[Type]]]],
+    out_state: Dict[str, Tuple[int, Dict[str, Type]]],
+    incoming: EdgeTable,
+    names: NameBits,
 ) -> None:
     blocks = fn.blocks
     entry = fn.entry
     seen: Set[str] = set()
-
-    def walk(name: str) -> None:
+    call_terminated: Set[str] = set()
+
+    # Explicit-stack DFS visiting blocks and checking edges in the same order as a
+    # recursive walk. A call's error edge is checked only after the normal
+    # successor's subtree, so it is queued as a (source, edge) entry.
+    stack: List[str | Tuple[str, mir.Edge]] = [entry]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            source, edge = item
+            _ensure_edge(fn, edge, blocks[source], source_block=source, out_state=out_state, error=True, names=names)
+            stack.append(edge.target)
+            continue
+        name = item
         if name in seen:
-            return
+            continue
         if name not in blocks:
             raise VerificationError(f"{fn.name}: edge to unknown block '{name}'")
         seen.add(name)
-        call_term = _call_terminator(blocks[name])
+        block = blocks[name]
+        call_term = _call_terminator(block)
         if call_term:
-            if call_term.normal:
-                _ensure_edge(fn, call_term.normal, blocks[name], source_block=name, out_state=out_state)
-                walk(call_term.normal.target)
+            call_terminated.add(name)
             if call_term.error:
-                _ensure_edge(fn, call_term.error, blocks[name], source_block=name, out_state=out_state, error=True)
-                walk(call_term.error.target)
-            return
-        term = blocks[name].terminator
+                stack.append((name, call_term.error))
+            if call_term.normal:
+                _ensure_edge(fn, call_term.normal, block, source_block=name, out_state=out_state, names=names)
+                stack.append(call_term.normal.target)
+            continue
+        term = block.terminator
         if isinstance(term, mir.Br):
-            _ensure_edge(fn, term.target, blocks[name], source_block=name, out_state=out_state)
-            walk(term.target.target)
+            _ensure_edge(fn, term.target, block, source_block=name, out_state=out_state, names=names)
+            stack.append(term.target.target)
         elif isinstance(term, mir.CondBr):
-            _ensure_edge(fn, term.then, blocks[name], source_block=name, out_state=out_state)
-            _ensure_edge(fn, term.els, blocks[name], source_block=name, out_state=out_state)
-            walk(term.then.target)
-            walk(term.els.target)
-        elif isinstance(term, (mir.Return, mir.Raise)):
-            return
-        else:
+            _ensure_edge(fn, term.then, block, source_block=name, out_state=out_state, names=names)
+            _ensure_edge(fn, term.els, block, source_block=name, out_state=out_state, names=names)
+            stack.append(term.els.target)
+            stack.append(term.then.target)
+        elif not isinstance(term, (mir.Return, mir.Raise)):
             raise VerificationError(f"{fn.name}:{name}: unsupported terminator")
 
-    walk(entry)
     if len(seen) != len(blocks):
         missing = set(blocks.keys()) - seen
         raise VerificationError(f"{fn.name}: unreachable blocks: {', '.join(sorted(missing))}")
 
     # Validate incoming args vs block params
+    edge_sources, edge_args = incoming.sources, incoming.args
     for block_name, block in blocks.items():
         param_types = [p.type for p in block.params]
-        for args, arg_types in incoming.get(block_name, []):
+        for i in incoming.per_target.get(block_name, ()):
+            args = edge_args[i]
             if len(args) != len(param_types):
                 raise VerificationError(
                     f"{fn.name}:{block_name}: predecessor passed {len(args)} args, expected {len(param_types)}"
                 )
-            for idx, (a_ty, p_ty) in enumerate(zip(arg_types, param_types)):
-                if a_ty is not None and a_ty != p_ty:
+            src_types = out_state.get(edge_sources[i], (0, {}))[1]
+            for idx, (arg, p_ty) in enumerate(zip(args, param_types)):
+                a_ty = src_types.get(arg)
+                if a_ty is not None and a_ty is not p_ty and a_ty != p_ty:
                     raise VerificationError(
                         f"{fn.name}:{block_name}: arg {idx} type mismatch from predecessor"
                     )
         # Ensure block params are defined before use in the block (in_state seeds)
-        in_defs = out_state.get(block_name, (set(), {}))[0] if out_state else set()
+        in_defs = out_state.get(block_name, (0, {}))[0] if out_state else 0
         for param in block.params:
-            if param.name not in in_defs:
+            if not in_defs & names.bit(param.name):
                 raise VerificationError(f"{fn.name}:{block_name}: param '{param.name}' not available at block entry")
-    for block in fn.blocks.values():
+    # The walk already checked every branch edge except those of blocks it left
+    # through a trailing call; check any branch terminator those still carry.
+    for name, block in blocks.items():
+        if name not in call_terminated:
+            continue
         if isinstance(block.terminator, mir.Br):
-            _ensure_edge(fn, block.terminator.target, block, source_block=block.name, out_state=out_state)
+            _ensure_edge(fn, block.terminator.target, block, source_block=block.name, out_state=out_state, names=names)
         elif isinstance(block.terminator, mir.CondBr):
-            _ensure_edge(fn, block.terminator.then, block, source_block=block.name, out_state=out_state)
-            _ensure_edge(fn, block.terminator.els, block, source_block=block.name, out_state=out_state)
+            _ensure_edge(fn, block.terminator.then, block, source_block=block.name, out_state=out_state, names=names)
+            _ensure_edge(fn, block.terminator.els, block, source_block=block.name, out_state=out_state, names=names)
 
 
 def _verify_block(
     fn: mir.Function,
     block: mir.BasicBlock,
     program: mir.Program | None = None,
-    incoming: Dict[str, List[tuple[List[str], List[Type]]]] | None = None,
-    in_state: Dict[str, Tuple[Set[str], Dict[str, Type]]] | None = None,
-    out_state: Dict[str, Tuple[Set[str], Dict[str, Type]]] | None = None,
+    incoming: EdgeTable | None = None,
+    in_state: Dict[str, Tuple[int, Dict[str, Type]]] | None = None,
+    out_state: Dict[str, Tuple[int, Dict[str, Type]]] | None = None,
     dominators: Dict[str, Set[str]] | None = None,
     def_blocks: Dict[str, Set[str]] | None = None,
+    *,
+    names: NameBits,
 ) -> None:
-    state = State()
+    state = State(names)
     if in_state and block.name in in_state:
         defs_in, types_in = in_state[block.name]
-        state.defined = set(defs_in)
+        state.seed(defs_in)
         state.types = dict(types_in)
     else:
         for param in block.params:
             state.define(param.name)
             state.set_type(param.name, param.type)
+    bit = state.names.bit
+
+    def use(name: str, ctx: str) -> None:
+        if state.live & bit(name):
+            return
+        # Slow path only to pick the right diagnostic (or accept a dominating def).
+        _ensure_defined(state, name, block, ctx, None, dominators, def_blocks)
+        _ensure_not_moved_or_dropped(state, name, block, ctx)
+
+    lookup_handler = _INSTR_VERIFIERS.get
     for instr in block.instructions:
-        if isinstance(instr, mir.Const):
-            _ensure_not_defined(state, instr.dest, block, "const")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.Move):
-            _ensure_defined(state, instr.source, block, "move", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.source, block, "move")
-            # Allow reassignments (mutations) by permitting dest to already be defined.
-            state.define(instr.dest)
-            state.move(instr.source)
-        elif isinstance(instr, mir.Copy):
-            _ensure_defined(state, instr.source, block, "copy", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.source, block, "copy")
-            _ensure_not_defined(state, instr.dest, block, "copy")
-            state.define(instr.dest)
-        elif isinstance(instr, (mir.Call, mir.CallWithCtx)):
-            for arg in instr.args:
-                _ensure_defined(state, arg, block, "call", None, dominators, def_blocks)
-                _ensure_not_moved_or_dropped(state, arg, block, "call")
-            _ensure_not_defined(state, instr.dest, block, "call")
-            state.define(instr.dest)
-            if instr.err_dest:
-                _ensure_not_defined(state, instr.err_dest, block, "call")
-                state.define(instr.err_dest)
-                state.set_type(instr.err_dest, ERROR)
-            if instr.normal or instr.error:
-                if instr.normal:
-                    _ensure_edge(fn, instr.normal, block, source_block=block.name, out_state=out_state, error=False)
-                if instr.error:
-                    _ensure_edge(fn, instr.error, block, source_block=block.name, out_state=out_state, error=True)
-                return  # call with edges acts as terminator
-        elif isinstance(instr, mir.StructInit):
-            for arg in instr.args:
-                _ensure_defined(state, arg, block, "struct_init", None, dominators, def_blocks)
-                _ensure_not_moved_or_dropped(state, arg, block, "struct_init")
-            _ensure_not_defined(state, instr.dest, block, "struct_init")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.FieldGet):
-            _ensure_defined(state, instr.base, block, "field_get", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.base, block, "field_get")
-            _ensure_not_defined(state, instr.dest, block, "field_get")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.ArrayInit):
-            for elem in instr.elements:
-                _ensure_defined(state, elem, block, "array_init", None, dominators, def_blocks)
-                _ensure_not_moved_or_dropped(state, elem, block, "array_init")
-            _ensure_not_defined(state, instr.dest, block, "array_init")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.ArrayLiteral):
-            for elem in instr.elements:
-                _ensure_defined(state, elem, block, "array_literal", None, dominators, def_blocks)
-                _ensure_not_moved_or_dropped(state, elem, block, "array_literal")
-            _ensure_not_defined(state, instr.dest, block, "array_literal")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.ArrayGet):
-            _ensure_defined(state, instr.base, block, "array_get", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.base, block, "array_get")
-            _ensure_defined(state, instr.index, block, "array_get", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.index, block, "array_get")
-            _ensure_not_defined(state, instr.dest, block, "array_get")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.ArraySet):
-            _ensure_defined(state, instr.base, block, "array_set", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.base, block, "array_set")
-            _ensure_defined(state, instr.index, block, "array_set", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.index, block, "array_set")
-            _ensure_defined(state, instr.value, block, "array_set", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.value, block, "array_set")
-        elif isinstance(instr, mir.Unary):
-            _ensure_defined(state, instr.operand, block, "unary", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.operand, block, "unary")
-            _ensure_not_defined(state, instr.dest, block, "unary")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.Binary):
-            _ensure_defined(state, instr.left, block, "binary", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.left, block, "binary")
-            _ensure_defined(state, instr.right, block, "binary", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.right, block, "binary")
-            _ensure_not_defined(state, instr.dest, block, "binary")
-            state.define(instr.dest)
-        elif isinstance(instr, mir.ConsoleWrite):
-            _ensure_defined(state, instr.value, block, "console_write", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.value, block, "console_write")
-        elif isinstance(instr, mir.ConsoleWriteln):
-            _ensure_defined(state, instr.value, block, "console_writeln", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.value, block, "console_writeln")
-        elif isinstance(instr, mir.Drop):
-            _ensure_defined(state, instr.value, block, "drop", None, dominators, def_blocks)
-            _ensure_not_moved_or_dropped(state, instr.value, block, "drop")
-            state.drop(instr.value)
-        else:
+        handler = lookup_handler(type(instr))
+        if handler is None:
             raise VerificationError(f"{fn.name}:{block.name}: unsupported instruction {instr}")
+        handler(instr, state, block, use)
+        if handler is _verify_call and (instr.normal or instr.error):
+            if instr.normal:
+                _ensure_edge(fn, instr.normal, block, source_block=block.name, out_state=out_state, error=False, names=state.names)
+            if instr.error:
+                _ensure_edge(fn, instr.error, block, source_block=block.name, out_state=out_state, error=True, names=state.names)
+            return  # call with edges acts as terminator
 
     term = block.terminator
     if isinstance(term, mir.Br):
-        _ensure_edge(fn, term.target, block, source_block=block.name, out_state=out_state)
+        _ensure_edge(fn, term.target, block, source_block=block.name, out_state=out_state, names=state.names)
     elif isinstance(term, mir.CondBr):
         _ensure_defined(state, term.cond, block, "condbr", term.loc, dominators, def_blocks)
         _ensure_not_moved_or_dropped(state, term.cond, block, "condbr", term.loc)
-        _ensure_edge(fn, term.then, block, source_block=block.name, out_state=out_state)
-        _ensure_edge(fn, term.els, block, source_block=block.name, out_state=out_state)
+        _ensure_edge(fn, term.then, block, source_block=block.name, out_state=out_state, names=state.names)
+        _ensure_edge(fn, term.els, block, source_block=block.name, out_state=out_state, names=state.names)
     elif isinstance(term, mir.Return):
         if term.value is not None:
             _ensure_defined(state, term.value, block, "return", term.loc, dominators, def_blocks)
             _ensure_not_moved_or_dropped(state, term.value, block, "return", term.loc)
             # type check
-            val_ty = out_state.get(block.name, (set(), {}))[1].get(term.value) if out_state else None
-            if val_ty and val_ty != fn.return_type:
+            val_ty = out_state.get(block.name, (0, {}))[1].get(term.value) if out_state else None
+            if val_ty and val_ty is not fn.return_type and val_ty != fn.return_type:
                 raise VerificationError(
                     f"{fn.name}:{block.name}: return type mismatch, expected {fn.return_type}, got {val_ty}"
                 )
     elif isinstance(term, mir.Raise):
         _ensure_defined(state, term.error, block, "raise", term.loc, dominators, def_blocks)
         _ensure_not_moved_or_dropped(state, term.error, block, "raise", term.loc)
-        err_ty = out_state.get(block.name, (set(), {}))[1].get(term.error) if out_state else None
-        if err_ty and err_ty != ERROR:
+        err_ty = out_state.get(block.name, (0, {}))[1].get(term.error) if out_state else None
+        if err_ty and err_ty is not ERROR and err_ty != ERROR:
             raise VerificationError(f"{fn.name}:{block.name}: raise expects Error, got {err_ty}")
     else:
         raise VerificationError(f"{fn.name}:{block.name}: missing or unsupported terminator")
@@ -433,7 +580,8 @@ def _loc_for(block: mir.BasicBlock, loc: Optional[mir.Location]) -> str:
     return f"{src}:{line}"
 
 
-def _compute_dominators(fn: mir.Function) -> Dict[str, Set[str]]:
+def _compute_dominators(fn: mir.Function, order: List[str] | None = None) -> Dict[str, Set[str]]:
+    """Dominator sets over branch edges, iterated in `order` (reverse postorder converges fastest)."""
     blocks = fn.blocks
     dom: Dict[str, Set[str]] = {name: set(blocks.keys()) for name in blocks}
     dom[fn.entry] = {fn.entry}
@@ -449,7 +597,7 @@ def _compute_dominators(fn: mir.Function) -> Dict[str, Set[str]]:
     changed = True
     while changed:
         changed = False
-        for name in blocks:
+        for name in order or blocks:
             if name == fn.entry:
                 continue
             pred_sets = [dom[p] for p in preds[name]] or [set(blocks.keys())]
@@ -479,12 +627,13 @@ def _ensure_defined(
     raise VerificationError(f"{block.name}: {ctx}: '{name}' is undefined at {_loc_for(block, loc)}")
 
 
-def _ensure_not_defined(state: State, name: str, block: mir.BasicBlock, ctx: str, loc: Optional[mir.Location] = None) -> None:
-    if state.is_defined(name):
-        # Allow compiler-generated temporaries (_t*) to be redefined in cyclic CFGs produced by the minimal lowering.
-        if name.startswith("_t"):
-            return
+def _define_dest(state: State, name: str, block: mir.BasicBlock, ctx: str, loc: Optional[mir.Location] = None) -> None:
+    """Define an instruction's dest, rejecting a redefinition; the name is interned once for both."""
+    bit = state.names.bit(name)
+    # Allow compiler-generated temporaries (_t*) to be redefined in cyclic CFGs produced by the minimal lowering.
+    if state.defined & bit and not name.startswith("_t"):
         raise VerificationError(f"{block.name}: {ctx}: '{name}' already defined at {_loc_for(block, loc)}")
+    state.define_bit(bit)
 
 
 def _ensure_not_moved_or_dropped(state: State, name: str, block: mir.BasicBlock, ctx: str, loc: Optional[mir.Location] = None) -> None:
@@ -499,29 +648,32 @@ def _ensure_edge(
     edge: mir.Edge,
     block: mir.BasicBlock,
     source_block: str,
-    out_state: Dict[str, Tuple[Set[str], Dict[str, Type]]] | None = None,
+    out_state: Dict[str, Tuple[int, Dict[str, Type]]] | None = None,
     error: bool = False,
+    *,
+    names: NameBits,
 ) -> None:
-    if edge.target not in fn.blocks:
+    dest_block = fn.blocks.get(edge.target)
+    if dest_block is None:
         raise VerificationError(f"{fn.name}:{block.name}: edge to unknown block '{edge.target}'")
-    dest_params = fn.blocks[edge.target].params
+    dest_params = dest_block.params
     if len(edge.args) != len(dest_params):
         raise VerificationError(
             f"{fn.name}:{block.name}: edge to '{edge.target}' expects {len(dest_params)} args, got {len(edge.args)}"
         )
     # Ensure args are defined in the source block
-    defined = out_state.get(source_block, (set(), {}))[0] if out_state else set()
+    defined, src_types = out_state.get(source_block, (0, {})) if out_state else (0, {})
+    bit = names.bit
     for arg in edge.args:
-        if arg not in defined:
+        if not defined & bit(arg):
             # Debug trace for unexpected misses
             # (can be removed once verifier is stable)
             # print(f"DEBUG edge from {source_block} to {edge.target}: defined={defined}, missing={arg}")
             raise VerificationError(f"{fn.name}:{block.name}: edge to '{edge.target}' references undefined '{arg}'")
-    # Type checks when available
-    src_types = out_state.get(source_block, (set(), {}))[1] if out_state else {}
+    # Type checks when available (identity first: primitives are singletons and array_of returns the _intern canonical instance)
     for arg, param in zip(edge.args, dest_params):
         arg_ty = src_types.get(arg)
-        if arg_ty and arg_ty != param.type:
+        if arg_ty and arg_ty is not param.type and arg_ty != param.type:
             raise VerificationError(
                 f"{fn.name}:{block.name}: edge to '{edge.target}' param '{param.name}' type mismatch"
             )
@@ -532,3 +684,112 @@ def _ensure_edge(
                 raise VerificationError(
                     f"{fn.name}:{block.name}: error edge '{edge.target}' first param must be Error"
                 )
+
+
+# Per-instruction checks for _verify_block, keyed on the exact instruction type.
+# `use(name, ctx)` checks that an operand is defined and not moved or dropped.
+_Use = Callable[[str, str], None]
+
+
+def _verify_const(instr: mir.Const, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    _define_dest(state, instr.dest, block, "const")
+
+
+def _verify_move(instr: mir.Move, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.source, "move")
+    # Allow reassignments (mutations) by permitting dest to already be defined.
+    state.define(instr.dest)
+    state.move(instr.source)
+
+
+def _verify_copy(instr: mir.Copy, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.source, "copy")
+    _define_dest(state, instr.dest, block, "copy")
+
+
+def _verify_call(instr: mir.Call | mir.CallWithCtx, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    for arg in instr.args:
+        use(arg, "call")
+    _define_dest(state, instr.dest, block, "call")
+    if instr.err_dest:
+        _define_dest(state, instr.err_dest, block, "call")
+        state.set_type(instr.err_dest, ERROR)
+
+
+def _verify_struct_init(instr: mir.StructInit, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    for arg in instr.args:
+        use(arg, "struct_init")
+    _define_dest(state, instr.dest, block, "struct_init")
+
+
+def _verify_field_get(instr: mir.FieldGet, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.base, "field_get")
+    _define_dest(state, instr.dest, block, "field_get")
+
+
+def _verify_array_init(instr: mir.ArrayInit, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    for elem in instr.elements:
+        use(elem, "array_init")
+    _define_dest(state, instr.dest, block, "array_init")
+
+
+def _verify_array_literal(instr: mir.ArrayLiteral, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    for elem in instr.elements:
+        use(elem, "array_literal")
+    _define_dest(state, instr.dest, block, "array_literal")
+
+
+def _verify_array_get(instr: mir.ArrayGet, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.base, "array_get")
+    use(instr.index, "array_get")
+    _define_dest(state, instr.dest, block, "array_get")
+
+
+def _verify_array_set(instr: mir.ArraySet, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.base, "array_set")
+    use(instr.index, "array_set")
+    use(instr.value, "array_set")
+
+
+def _verify_unary(instr: mir.Unary, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.operand, "unary")
+    _define_dest(state, instr.dest, block, "unary")
+
+
+def _verify_binary(instr: mir.Binary, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.left, "binary")
+    use(instr.right, "binary")
+    _define_dest(state, instr.dest, block, "binary")
+
+
+def _verify_console_write(instr: mir.ConsoleWrite, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.value, "console_write")
+
+
+def _verify_console_writeln(instr: mir.ConsoleWriteln, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.value, "console_writeln")
+
+
+def _verify_drop(instr: mir.Drop, state: State, block: mir.BasicBlock, use: _Use) -> None:
+    use(instr.value, "drop")
+    state.drop(instr.value)
+
+
+_INSTR_VERIFIERS: Dict[type, Callable[..., None]] = {
+    mir.Const: _verify_const,
+    mir.Move: _verify_move,
+    mir.Copy: _verify_copy,
+    mir.Call: _verify_call,
+    mir.CallWithCtx: _verify_call,
+    mir.StructInit: _verify_struct_init,
+    mir.FieldGet: _verify_field_get,
+    mir.ArrayInit: _verify_array_init,
+    mir.ArrayLiteral: _verify_array_literal,
+    mir.ArrayGet: _verify_array_get,
+    mir.ArraySet: _verify_array_set,
+    mir.Unary: _verify_unary,
+    mir.Binary: _verify_binary,
+    mir.ConsoleWrite: _verify_console_write,
+    mir.ConsoleWriteln: _verify_console_writeln,
+    mir.Drop: _verify_drop,
+}
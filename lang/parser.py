@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import ast
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from lark import Lark, Token, Tree
 
@@ -149,12 +150,19 @@ _PARSER = Lark(
     propagate_positions=True,
     maybe_placeholders=False,
     postlex=TerminatorInserter(),
+    cache=True,
 )
 
 
+_LOC_CACHE: Dict[tuple[int, int], Located] = {}
+
+
 def parse_program(source: str) -> Program:
     tree = _PARSER.parse(source)
-    return _build_program(tree)
+    try:
+        return _build_program(tree)
+    finally:
+        _LOC_CACHE.clear()
 
 
 def _build_program(tree: Tree) -> Program:
@@ -224,7 +232,7 @@ def _build_exception_def(tree: Tree) -> ExceptionDef:
                 if str_node:
                     import ast as _ast
                     domain_val = _ast.literal_eval(str_node.value)
-    return ExceptionDef(name=name_token.value, args=args, loc=loc, domain=domain_val)
+    return ExceptionDef(name=_ident(name_token), args=args, loc=loc, domain=domain_val)
 
 
 def _build_exception_arg(tree: Tree) -> ExceptionArg:
@@ -232,7 +240,7 @@ def _build_exception_arg(tree: Tree) -> ExceptionArg:
         raise ValueError("expected exception_param")
     name_token = next(child for child in tree.children if isinstance(child, Token) and child.type == "NAME")
     type_node = next(child for child in tree.children if isinstance(child, Tree) and _name(child) == "type_expr")
-    return ExceptionArg(name=name_token.value, type_expr=_build_type_expr(type_node))
+    return ExceptionArg(name=_ident(name_token), type_expr=_build_type_expr(type_node))
 
 
 def _build_function(tree: Tree) -> FunctionDef:
@@ -251,7 +259,7 @@ def _build_function(tree: Tree) -> FunctionDef:
     idx += 1
     body = _build_block(children[idx])
     return FunctionDef(
-        name=name_token.value,
+        name=_ident(name_token),
         params=params,
         return_type=return_type,
         body=body,
@@ -275,7 +283,7 @@ def _build_param(tree: Tree) -> Param:
     name_token = next(child for child in tree.children if isinstance(child, Token) and child.type == "NAME")
     type_node = next(child for child in tree.children if isinstance(child, Tree) and _name(child) == "type_expr")
     type_expr = _build_type_expr(type_node)
-    return Param(name=name_token.value, type_expr=type_expr)
+    return Param(name=_ident(name_token), type_expr=type_expr)
 
 
 def _build_type_expr(tree: Tree) -> TypeExpr:
@@ -299,7 +307,7 @@ def _build_type_expr(tree: Tree) -> TypeExpr:
             args = [
                 _build_type_expr(arg) for arg in type_args.children if isinstance(arg, Tree)
             ]
-        return TypeExpr(name=name_token.value, args=args)
+        return TypeExpr(name=_ident(name_token), args=args)
     # fallback for other wrappers
     if tree.children:
         return _build_type_expr(tree.children[-1])
@@ -388,7 +396,7 @@ def _build_let_stmt(tree: Tree) -> LetStmt:
     value_expr = _build_expr(child_nodes[idx])
     return LetStmt(
         loc=loc,
-        name=name_token.value,
+        name=_ident(name_token),
         type_expr=type_expr,
         value=value_expr,
         mutable=mutable,
@@ -421,7 +429,7 @@ def _build_for_stmt(tree: Tree) -> ForStmt:
         _build_stmt(child) for child in block_node.children if isinstance(child, Tree) and _name(child) == "stmt"
     ]
     body_stmts = [s for s in body_stmts if s is not None]
-    return ForStmt(loc=loc, var=name_token.value, iter_expr=iter_expr, body=Block(statements=body_stmts))
+    return ForStmt(loc=loc, var=_ident(name_token), iter_expr=iter_expr, body=Block(statements=body_stmts))
 
 
 def _parse_binding_name(tree: Tree) -> tuple[Token, bool]:
@@ -494,7 +502,7 @@ def _build_struct_def(tree: Tree) -> StructDef:
     body = tree.children[1]
     field_nodes = _collect_struct_fields(body)
     fields = [_build_struct_field(node) for node in field_nodes]
-    return StructDef(name=name_token.value, fields=fields, loc=loc)
+    return StructDef(name=_ident(name_token), fields=fields, loc=loc)
 
 
 def _collect_struct_fields(tree: Tree) -> List[Tree]:
@@ -514,7 +522,7 @@ def _collect_struct_fields(tree: Tree) -> List[Tree]:
 def _build_struct_field(tree: Tree) -> StructField:
     name_token = next(child for child in tree.children if isinstance(child, Token) and child.type == "NAME")
     type_node = next(child for child in tree.children if isinstance(child, Tree) and _name(child) == "type_expr")
-    return StructField(name=name_token.value, type_expr=_build_type_expr(type_node))
+    return StructField(name=_ident(name_token), type_expr=_build_type_expr(type_node))
 
 
 def _build_import_stmt(tree: Tree) -> ImportStmt:
@@ -676,7 +684,7 @@ def _build_expr(node) -> Expr:
         return Unary(loc=_loc(node), op="not", operand=expr)
     if name == "var":
         token = node.children[0]
-        return Name(loc=_loc(node), ident=token.value)
+        return Name(loc=_loc(node), ident=_ident(token))
     if name == "placeholder":
         return Placeholder(loc=_loc(node))
     if name == "int_lit":
@@ -794,7 +802,7 @@ def _build_leading_dot(tree: Tree) -> Expr:
     # Base receiver placeholder with an initial attribute name from the DOT NAME.
     name_tok = next(tok for tok in tree.children if isinstance(tok, Token) and tok.type == "NAME")
     base_loc = _loc(tree)
-    expr: Expr = Attr(loc=_loc_from_token(name_tok), value=Placeholder(loc=base_loc), attr=name_tok.value)
+    expr: Expr = Attr(loc=_loc_from_token(name_tok), value=Placeholder(loc=base_loc), attr=_ident(name_tok))
     suffix_nodes = [child for child in tree.children if isinstance(child, Tree)]
     return _apply_postfix_suffixes(expr, suffix_nodes)
 
@@ -818,7 +826,7 @@ def _apply_postfix_suffixes(expr: Expr, suffix_nodes: List[Tree]) -> Expr:
             attr_token = next(
                 token for token in child.children if isinstance(token, Token) and token.type == "NAME"
             )
-            expr = Attr(loc=_loc(child), value=expr, attr=attr_token.value)
+            expr = Attr(loc=_loc(child), value=expr, attr=_ident(attr_token))
         elif child_name == "move_suffix":
             expr = Move(loc=_loc(child), value=expr)
         elif child_name == "index_suffix":
@@ -852,16 +860,30 @@ def _build_kwarg(tree: Tree) -> KwArg:
     name_token = next(child for child in tree.children if isinstance(child, Token) and child.type == "NAME")
     value_node = next(child for child in tree.children if isinstance(child, Tree))
     value = _build_expr(value_node)
-    return KwArg(name=name_token.value, value=value)
+    return KwArg(name=_ident(name_token), value=value)
+
+
+def _ident(token: Token) -> str:
+    # Identifiers key every scope/struct dict downstream; share one str per spelling.
+    return sys.intern(token.value)
 
 
 def _loc(tree: Tree) -> Located:
     meta = tree.meta
-    return Located(line=meta.line, column=meta.column)
+    return _located(meta.line, meta.column)
 
 
 def _loc_from_token(token: Token) -> Located:
-    return Located(line=token.line, column=token.column)
+    return _located(token.line, token.column)
+
+
+def _located(line: int, column: int) -> Located:
+    # Located is frozen, so nodes starting at the same position can share one instance.
+    key = (line, column)
+    loc = _LOC_CACHE.get(key)
+    if loc is None:
+        loc = _LOC_CACHE[key] = Located(line=line, column=column)
+    return loc
 
 
 def _name(node: Tree | Token) -> str:
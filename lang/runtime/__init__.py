@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Callable, Dict, Mapping, Sequence
 
 from ..types import DISPLAYABLE, ERROR, STR, UNIT, I64, FunctionSignature, array_of, INT, Type
@@ -140,7 +141,14 @@ SPECIAL_SIGNATURES: Mapping[str, FunctionSignature] = {
 }
 
 
-def builtin_signatures() -> Dict[str, FunctionSignature]:
-    sigs = {name: builtin.signature for name, builtin in BUILTINS.items()}
-    sigs.update(SPECIAL_SIGNATURES)
-    return sigs
+_BUILTIN_SIGNATURES: Mapping[str, FunctionSignature] = MappingProxyType(
+    {
+        **{name: builtin.signature for name, builtin in BUILTINS.items()},
+        **SPECIAL_SIGNATURES,
+    }
+)
+
+
+def builtin_signatures() -> Mapping[str, FunctionSignature]:
+    """Signatures of all builtins; built once at import and returned as a read-only view."""
+    return _BUILTIN_SIGNATURES
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import operator
+import os
+import tempfile
 from pathlib import Path
 
 import sys
+import llvmlite
 from llvmlite import ir, binding as llvm  # type: ignore
 
 from . import mir
@@ -18,18 +23,13 @@ I64_TY = ir.IntType(64)
 I32_TY = ir.IntType(32)
 I1_TY = ir.IntType(1)
 ERROR_PTR_TY = ir.IntType(8).as_pointer()
-DRIFT_ERROR_ARG_PTR_TY = None  # legacy args; initialized lazily after _drift_string_type is defined
-DV_TY = None  # initialized lazily
 I8P = ir.IntType(8).as_pointer()
-
-
-def _drift_string_type() -> ir.LiteralStructType:
-    # { len: i64, ptr: i8* }
-    return ir.LiteralStructType([I64_TY, I8P])
-
-
-# initialize the arg pointer type after string type is defined
-DRIFT_ERROR_ARG_PTR_TY = ir.LiteralStructType([_drift_string_type(), _drift_string_type()]).as_pointer()
+# { len: i64, ptr: i8* }
+DRIFT_STRING_TY = ir.LiteralStructType([I64_TY, I8P])
+# Zeroed string value; string constants are built by inserting len/ptr into it.
+ZERO_STRING = ir.Constant.literal_struct([ir.Constant(I64_TY, 0), ir.Constant(I8P, None)])
+# legacy args
+DRIFT_ERROR_ARG_PTR_TY = ir.LiteralStructType([DRIFT_STRING_TY, DRIFT_STRING_TY]).as_pointer()
 # DiagnosticValue ABI (tag + union). Union is modeled as a byte array big enough for the largest primitive/string case.
 # Model DriftDiagnosticValue layout: tag (u8) + padding + 16-byte union (align 8).
 DV_TY = ir.LiteralStructType(
@@ -52,11 +52,66 @@ def _declare_dv_sret(module: ir.Module, name: str, arg_types: list[ir.Type]) ->
     return fn
 
 
+_TARGET_MACHINE: Optional[llvm.TargetMachine] = None
+
+
+def _target_machine() -> llvm.TargetMachine:
+    """Initialize LLVM once per process and return the shared native target machine."""
+    global _TARGET_MACHINE
+    if _TARGET_MACHINE is None:
+        llvm.initialize()
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        _TARGET_MACHINE = llvm.Target.from_default_triple().create_target_machine()
+    return _TARGET_MACHINE
+
+
+def _emit_object(ir_text: str) -> bytes:
+    """Parse and compile textual IR for the native target."""
+    return _target_machine().emit_object(llvm.parse_assembly(ir_text))
+
+
+def _object_for_ir(ir_text: str) -> bytes:
+    """Object code for `ir_text`, via the on-disk cache when DRIFT_OBJ_CACHE names a directory.
+
+    Entries are keyed by the IR text, the llvmlite/LLVM versions and the target
+    triple, so a toolchain or host change never reuses a stale object.
+    """
+    cache_dir = os.environ.get("DRIFT_OBJ_CACHE")
+    if not cache_dir:
+        return _emit_object(ir_text)
+    key = hashlib.blake2b(digest_size=16)
+    for part in (llvmlite.__version__, str(llvm.llvm_version_info), _target_machine().triple, ir_text):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    path = Path(cache_dir) / f"{key.hexdigest()}.o"
+    try:
+        return path.read_bytes()
+    except OSError:
+        pass
+    obj = _emit_object(ir_text)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a uniquely named temp file, then rename, so concurrent writers
+        # (threads or processes) never share a temp path or expose a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(obj)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    except OSError:
+        pass  # the cache is best-effort; the object is still returned
+    return obj
+
+
 def emit_dummy_main_object(out_path: Path) -> None:
     """Emit a trivial main that returns 0."""
-    llvm.initialize()
-    llvm.initialize_native_target()
-    llvm.initialize_native_asmprinter()
 
     mod = ir.Module(name="ssa_dummy")
     int32 = ir.IntType(32)
@@ -66,13 +121,72 @@ def emit_dummy_main_object(out_path: Path) -> None:
     builder = ir.IRBuilder(entry_bb)
     builder.ret(int32(0))
 
-    target = llvm.Target.from_default_triple()
-    tm = target.create_target_machine()
-    obj = tm.emit_object(llvm.parse_assembly(str(mod)))
+    obj = _object_for_ir(str(mod))
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_bytes(obj)
 
 
+# Builtin Drift types are identified by name alone, so the mapping is one dict probe.
+_LLVM_TYPES_BY_NAME: dict[str, ir.Type] = {
+    "Int": WORD_INT,
+    "Int64": I64_TY,
+    "Int32": I32_TY,
+    "Float64": ir.DoubleType(),
+    "Float": ir.DoubleType(),
+    "Bool": I1_TY,
+    "Error": ERROR_PTR_TY,
+    "Void": ir.VoidType(),
+    "String": DRIFT_STRING_TY,
+    "DiagnosticValue": DV_TY,
+}
+
+
+# Integer Binary ops lowered to a single IRBuilder call.
+_INT_ARITH_OPS = {
+    "+": ir.IRBuilder.add,
+    "-": ir.IRBuilder.sub,
+    "*": ir.IRBuilder.mul,
+}
+_INT_COMPARE_OPS = frozenset({"==", "!=", "<", "<=", ">", ">="})
+# Python evaluation of the same ops, for folding Binary on two integer constants.
+_INT_FOLDS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _as_signed(value: int, width: int) -> int:
+    value &= (1 << width) - 1
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+def _fold_int_binary(op: str, lhs: ir.Value, rhs: ir.Value) -> Optional[ir.Constant]:
+    """Fold a Binary whose operands are same-width integer constants; None if either is not one.
+
+    Operands are read as signed and arithmetic wraps to the operand width,
+    matching the `add`/`sub`/`mul` and `icmp` signed forms the builder would emit.
+    """
+    if not (isinstance(lhs, ir.Constant) and isinstance(rhs, ir.Constant)):
+        return None
+    ty = lhs.type
+    if not isinstance(ty, ir.IntType) or rhs.type != ty:
+        return None
+    if not (isinstance(lhs.constant, int) and isinstance(rhs.constant, int)):
+        return None
+    fold = _INT_FOLDS[op]
+    result = fold(_as_signed(lhs.constant, ty.width), _as_signed(rhs.constant, ty.width))
+    if op in _INT_COMPARE_OPS:
+        return ir.Constant(I1_TY, int(result))
+    return ir.Constant(ty, _as_signed(result, ty.width))
+
+
 def _llvm_type(ty: Type) -> ir.Type:
     """Map Drift types to LLVM types (minimal surface).
 
@@ -83,30 +197,15 @@ def _llvm_type(ty: Type) -> ir.Type:
     - Bool      → i1
     - Void      → void
     """
-    if ty.name == "Int":
-        return WORD_INT
-    if ty.name == "Int64":
-        return I64_TY
-    if ty.name == "Int32":
-        return I32_TY
-    if ty.name == "Float64" or ty.name == "Float":
-        return ir.DoubleType()
-    if ty == BOOL or ty.name == "Bool":
-        return I1_TY
-    if ty == ERROR or ty.name == "Error":
-        return ERROR_PTR_TY
-    if ty == UNIT or ty.name == "Void":
-        return ir.VoidType()
-    if ty == STR or ty.name == "String":
-        return _drift_string_type()
-    if ty.name == "DiagnosticValue":
-        return DV_TY
+    ll_ty = _LLVM_TYPES_BY_NAME.get(ty.name)
+    if ll_ty is not None:
+        return ll_ty
     raise NotImplementedError(f"unsupported type {ty}")
 
 
 def emit_simple_main_object(fn: mir.Function, out_path: Path) -> None:
     """Legacy helper kept for compatibility; emit a single function as main."""
-    emit_module_object([fn], fn.name, out_path)
+    emit_module_object([fn], {}, fn.name, out_path)
 
 
 def emit_module_object(
@@ -117,18 +216,16 @@ def emit_module_object(
     exception_names: Optional[set[str]] = None,
 ) -> None:
     """Lower a small set of SSA functions (ints + branches + calls) into LLVM."""
-    llvm.initialize()
-    llvm.initialize_native_target()
-    llvm.initialize_native_asmprinter()
 
     mod = ir.Module(name="ssa_main")
     # First pass: create LLVM functions and basic blocks.
     fn_map: dict[str, ir.Function] = {}
-    blocks_map: dict[tuple[str, str], ir.Block] = {}
+    blocks_map: dict[str, dict[str, ir.Block]] = {}
     struct_type_cache: dict[str, ir.Type] = {}
     # Track which functions are allowed to produce errors; MIR should already mark them.
     can_error_funcs: set[str] = {f.name for f in funcs if getattr(f, "can_error", False)}
     # Cached runtime decls
+    rt_console_writeln: Optional[ir.Function] = None
     rt_error_dummy: Optional[ir.Function] = None
     rt_error_add_attr_dv: Optional[ir.Function] = None
     rt_error_add_local_dv: Optional[ir.Function] = None
@@ -225,21 +322,31 @@ def emit_module_object(
         param_tys = [_llvm_type_with_structs(p.type) for p in f.params]
         llvm_fn = ir.Function(mod, ir.FunctionType(ret_ty, param_tys), name=f.name)
         fn_map[f.name] = llvm_fn
+        fblocks = blocks_map[f.name] = {}
         for bname in f.blocks:
             if bname in reachable:
-                blocks_map[(f.name, bname)] = llvm_fn.append_basic_block(bname)
+                fblocks[bname] = llvm_fn.append_basic_block(bname)
 
+    # One builder for all function bodies, repositioned per block.
+    builder = ir.IRBuilder()
     for f in funcs:
         reachable = _reachable(f)
         llvm_fn = fn_map[f.name]
-        phis: dict[tuple[str, str], ir.Instruction] = {}
+        # Return-shape facts used by every Return/Throw terminator of this function.
+        fn_can_error = f.name in can_error_funcs
+        fn_ret_ll_ty = _llvm_type_with_structs(f.return_type)
+        fn_ret_is_void = isinstance(fn_ret_ll_ty, ir.VoidType)
+        fn_ret_pair_ty = llvm_ret_with_error(f.return_type) if fn_can_error else None
+        fblocks = blocks_map[f.name]
+        # Block name -> PHIs in block-param order, so edge args zip straight onto them.
+        phis: dict[str, list[ir.Instruction]] = {}
         values: dict[str, ir.Value] = {}
         module = llvm_fn.module
         # Map SSA names to types for struct lookups.
         ssa_types: dict[str, Type] = {}
         # Allocate struct slots in entry for any struct-typed SSA values.
         struct_slots: dict[str, ir.Instruction] = {}
-        entry_block = blocks_map[(f.name, f.entry)]
+        entry_block = fblocks[f.entry]
         entry_builder = ir.IRBuilder(entry_block)
         entry_builder.position_at_start(entry_block)
 
@@ -288,7 +395,7 @@ def emit_module_object(
         for bname, block in f.blocks.items():
             if bname not in reachable:
                 continue
-            builder = ir.IRBuilder(blocks_map[(f.name, bname)])
+            builder.position_at_end(fblocks[bname])
             if bname == f.entry and block.params:
                 if len(block.params) != len(f.params):
                     raise RuntimeError(f"entry block params arity mismatch in {f.name}")
@@ -298,19 +405,31 @@ def emit_module_object(
                     if param.type.name in struct_layouts and param.name in struct_slots:
                         values[param.name] = struct_slots[param.name]
             else:
+                block_phis = phis[bname] = []
                 for param in block.params:
                     phi = builder.phi(_llvm_type_with_structs(param.type), name=param.name)
-                    phis[(bname, param.name)] = phi
+                    block_phis.append(phi)
                     values[param.name] = phi
                     ssa_types[param.name] = param.type
 
+        def _load_if_ref(name: str):
+            val = values[name]
+            ty = ssa_types.get(name)
+            if isinstance(ty, ReferenceType):
+                val = builder.load(val)
+                ty = ty.args[0]
+            return val, ty
+
         # Emit instructions and terminators.
         for bname, block in f.blocks.items():
             if bname not in reachable:
                 continue
-            builder = ir.IRBuilder(blocks_map[(f.name, bname)])
+            cur_block = fblocks[bname]
+            builder.position_at_end(cur_block)
             for instr in block.instructions:
-                if isinstance(instr, mir.Const):
+                # MIR instruction classes are disjoint, so dispatch on the exact type.
+                kind = type(instr)
+                if kind is mir.Const:
                     if instr.type == ERROR or instr.type.name == "Error":
                         if instr.value not in (None, 0):
                             raise RuntimeError("Error const supports only null")
@@ -337,24 +456,22 @@ def emit_module_object(
                             name=f"strptr{len(module.globals)}",
                         )
                         strlen = ir.Constant(I64_TY, len(data) - 1)
-                        str_ty = _drift_string_type()
-                        zero_struct = ir.Constant.literal_struct([ir.Constant(I64_TY, 0), ir.Constant(I8P, None)])
-                        tmp = builder.insert_value(zero_struct, strlen, 0)
+                        tmp = builder.insert_value(ZERO_STRING, strlen, 0)
                         str_val = builder.insert_value(tmp, ptr, 1)
                         values[instr.dest] = str_val
                         ssa_types[instr.dest] = instr.type
                     else:
                         raise RuntimeError("simple backend supports int/bool/string const only")
-                elif isinstance(instr, mir.Move):
+                elif kind is mir.Move:
                     values[instr.dest] = values[instr.source]
                     ssa_types[instr.dest] = ssa_types.get(instr.source, ssa_types.get(instr.dest))
                     if instr.dest in struct_slots and instr.source in values:
                         # propagate pointer mapping if applicable
                         values[instr.dest] = values[instr.source]
-                elif isinstance(instr, mir.Alloc):
+                elif kind is mir.Alloc:
                     # Already emitted in the pre-pass above.
                     continue
-                elif isinstance(instr, mir.Store):
+                elif kind is mir.Store:
                     base_val = values.get(instr.base)
                     if base_val is None:
                         raise RuntimeError(f"store base {instr.base} undefined")
@@ -381,41 +498,25 @@ def emit_module_object(
                     ):
                         val = builder.load(val)
                     builder.store(val, base_val)
-                elif isinstance(instr, mir.Binary):
-                    def _load_if_ref(name: str):
-                        val = values[name]
-                        ty = ssa_types.get(name)
-                        if isinstance(ty, ReferenceType):
-                            val = builder.load(val)
-                            ty = ty.args[0]
-                        return val, ty
+                elif kind is mir.Binary:
                     lhs, lhs_ty = _load_if_ref(instr.left)
                     rhs, rhs_ty = _load_if_ref(instr.right)
-                    if instr.op == "+":
-                        values[instr.dest] = builder.add(lhs, rhs, name=instr.dest)
-                        ssa_types[instr.dest] = lhs_ty or rhs_ty
-                    elif instr.op == "-":
-                        values[instr.dest] = builder.sub(lhs, rhs, name=instr.dest)
+                    arith = _INT_ARITH_OPS.get(instr.op)
+                    folded = _fold_int_binary(instr.op, lhs, rhs) if instr.op in _INT_FOLDS else None
+                    if folded is not None:
+                        values[instr.dest] = folded
+                        ssa_types[instr.dest] = BOOL if arith is None else lhs_ty or rhs_ty
+                    elif arith is not None:
+                        values[instr.dest] = arith(builder, lhs, rhs, name=instr.dest)
                         ssa_types[instr.dest] = lhs_ty or rhs_ty
-                    elif instr.op == "*":
-                        values[instr.dest] = builder.mul(lhs, rhs, name=instr.dest)
-                        ssa_types[instr.dest] = lhs_ty or rhs_ty
-                    elif instr.op in {"==", "!=", "<", "<=", ">", ">="}:
-                        pred_map = {
-                            "==": "==",
-                            "!=": "!=",
-                            "<": "<",
-                            "<=": "<=",
-                            ">": ">",
-                            ">=": ">=",
-                        }
-                        pred = pred_map[instr.op]
-                        cmp = builder.icmp_signed(pred, lhs, rhs, name=f"cmp_{instr.dest}")
+                    elif instr.op in _INT_COMPARE_OPS:
+                        # Drift comparison spellings are LLVM's signed icmp predicates.
+                        cmp = builder.icmp_signed(instr.op, lhs, rhs, name=f"cmp_{instr.dest}")
                         values[instr.dest] = cmp
                         ssa_types[instr.dest] = BOOL
                     else:
                         raise RuntimeError(f"unsupported binary op {instr.op}")
-                elif isinstance(instr, mir.Call):
+                elif kind is mir.Call:
                     callee: Optional[ir.Function] = None
                     if instr.normal or instr.error:
                         raise RuntimeError("call with edges not yet supported in SSA backend")
@@ -424,15 +525,17 @@ def emit_module_object(
                         if len(instr.args) != 1:
                             raise RuntimeError("out.writeln expects one arg")
                         arg_val = values[instr.args[0]]
-                        console_fn = module.globals.get("drift_console_writeln")
-                        if not isinstance(console_fn, ir.Function):
-                            console_fn = ir.Function(
-                                module, ir.FunctionType(ir.VoidType(), (_drift_string_type(),)), name="drift_console_writeln"
-                            )
-                        builder.call(console_fn, [arg_val])
-                        if not isinstance(_llvm_type(instr.ret_type), ir.VoidType):
+                        if rt_console_writeln is None:
+                            rt_console_writeln = module.globals.get("drift_console_writeln")
+                            if not isinstance(rt_console_writeln, ir.Function):
+                                rt_console_writeln = ir.Function(
+                                    module, ir.FunctionType(ir.VoidType(), (DRIFT_STRING_TY,)), name="drift_console_writeln"
+                                )
+                        builder.call(rt_console_writeln, [arg_val])
+                        ret_ll_ty = _llvm_type(instr.ret_type)
+                        if not isinstance(ret_ll_ty, ir.VoidType):
                             # map dest to undef to keep SSA map consistent
-                            values[instr.dest] = ir.Constant(_llvm_type(instr.ret_type), None)
+                            values[instr.dest] = ir.Constant(ret_ll_ty, None)
                         continue
                     elif instr.callee in struct_layouts:
                         layout = struct_layouts[instr.callee]
@@ -473,7 +576,7 @@ def emit_module_object(
                                     rt_error_dummy = ir.Function(
                                         module,
                                         ir.FunctionType(
-                                            ERROR_PTR_TY, [WORD_INT, _drift_string_type(), _drift_string_type()]
+                                            ERROR_PTR_TY, [WORD_INT, DRIFT_STRING_TY, DRIFT_STRING_TY]
                                         ),
                                         name="drift_error_new_dummy",
                                     )
@@ -482,7 +585,7 @@ def emit_module_object(
                                 if rt_error_add_attr_dv is None:
                                     rt_error_add_attr_dv = ir.Function(
                                         module,
-                                        ir.FunctionType(ir.VoidType(), [ERROR_PTR_TY, _drift_string_type(), DV_TY.as_pointer()]),
+                                        ir.FunctionType(ir.VoidType(), [ERROR_PTR_TY, DRIFT_STRING_TY, DV_TY.as_pointer()]),
                                         name="drift_error_add_attr_dv",
                                     )
                                 callee = rt_error_add_attr_dv
@@ -492,7 +595,7 @@ def emit_module_object(
                                         module,
                                         ir.FunctionType(
                                             ir.VoidType(),
-                                            [ERROR_PTR_TY, _drift_string_type(), _drift_string_type(), DV_TY],
+                                            [ERROR_PTR_TY, DRIFT_STRING_TY, DRIFT_STRING_TY, DV_TY],
                                         ),
                                         name="drift_error_add_local_dv",
                                     )
@@ -503,7 +606,7 @@ def emit_module_object(
                                 callee = rt_dv_int
                             elif instr.callee == "drift_dv_string":
                                 if rt_dv_string is None:
-                                    rt_dv_string = _declare_dv_sret(module, "drift_dv_string", [_drift_string_type()])
+                                    rt_dv_string = _declare_dv_sret(module, "drift_dv_string", [DRIFT_STRING_TY])
                                 callee = rt_dv_string
                             elif instr.callee == "drift_dv_bool":
                                 if rt_dv_bool is None:
@@ -527,7 +630,7 @@ def emit_module_object(
                                     setattr(callee, "_dv_sret", True)
                             elif instr.callee == "drift_dv_get":
                                 if rt_dv_get is None:
-                                    rt_dv_get = _declare_dv_sret(module, "drift_dv_get", [DV_TY, _drift_string_type()])
+                                    rt_dv_get = _declare_dv_sret(module, "drift_dv_get", [DV_TY, DRIFT_STRING_TY])
                                 callee = rt_dv_get
                             elif instr.callee == "drift_dv_index":
                                 if rt_dv_index is None:
@@ -554,7 +657,7 @@ def emit_module_object(
                             elif instr.callee == "drift_diag_from_string":
                                 callee = module.globals.get("drift_diag_from_string")
                                 if callee is None:
-                                    callee = _declare_dv_sret(module, "drift_diag_from_string", [_drift_string_type()])
+                                    callee = _declare_dv_sret(module, "drift_diag_from_string", [DRIFT_STRING_TY])
                                 else:
                                     setattr(callee, "_dv_sret", True)
                             elif instr.callee == "drift_diag_from_optional_int":
@@ -628,14 +731,14 @@ def emit_module_object(
                             elif instr.callee == "drift_string_eq":
                                 callee = ir.Function(
                                     module,
-                                    ir.FunctionType(WORD_INT, [_drift_string_type(), _drift_string_type()]),
+                                    ir.FunctionType(WORD_INT, [DRIFT_STRING_TY, DRIFT_STRING_TY]),
                                     name="drift_string_eq",
                                 )
                             elif instr.callee == "__exc_attrs_get_dv":
                                 if rt_exc_attrs_get_dv is None:
                                     rt_exc_attrs_get_dv = ir.Function(
                                         module,
-                                        ir.FunctionType(ir.VoidType(), [DV_TY.as_pointer(), ERROR_PTR_TY, _drift_string_type()]),
+                                        ir.FunctionType(ir.VoidType(), [DV_TY.as_pointer(), ERROR_PTR_TY, DRIFT_STRING_TY]),
                                         name="__exc_attrs_get_dv",
                                     )
                                 callee = rt_exc_attrs_get_dv
@@ -756,7 +859,7 @@ def emit_module_object(
                             ) from exc
                         values[instr.dest] = call_val
                     ssa_types[instr.dest] = instr.ret_type
-                elif isinstance(instr, mir.StructInit):
+                elif kind is mir.StructInit:
                     if instr.type.name not in struct_layouts:
                         raise RuntimeError(f"unknown struct type {instr.type}")
                     if instr.dest not in struct_slots:
@@ -774,23 +877,23 @@ def emit_module_object(
                         builder.store(arg_val, field_ptr)
                     values[instr.dest] = slot
                     ssa_types[instr.dest] = instr.type
-                elif isinstance(instr, mir.FieldSet):
+                elif kind is mir.FieldSet:
                     base_ty = ssa_types.get(instr.base)
                     inner_ty = base_ty.args[0] if isinstance(base_ty, ReferenceType) else base_ty
                     if inner_ty is None or inner_ty.name not in struct_layouts:
                         raise RuntimeError(f"base {instr.base} is not a struct for field set")
                     layout = struct_layouts[inner_ty.name]
-                    if instr.field not in layout.index_by_name:
+                    idx = layout.index_by_name.get(instr.field)
+                    if idx is None:
                         raise RuntimeError(f"struct {inner_ty.name} has no field {instr.field}")
                     base_ptr = values.get(instr.base) if isinstance(base_ty, ReferenceType) else struct_slots.get(instr.base)
                     if base_ptr is None:
                         base_ptr = values.get(instr.base)
                     if base_ptr is None:
                         raise RuntimeError(f"no struct slot for {instr.base}")
-                    idx = layout.index_by_name[instr.field]
                     field_ptr = builder.gep(base_ptr, [I32_TY(0), I32_TY(idx)], inbounds=True)
                     builder.store(values[instr.value], field_ptr)
-                elif isinstance(instr, mir.FieldGet):
+                elif kind is mir.FieldGet:
                     base_ty = ssa_types.get(instr.base)
                     if base_ty == ERROR:
                         base_ptr = values[instr.base]
@@ -821,14 +924,14 @@ def emit_module_object(
                     if inner_ty is None or inner_ty.name not in struct_layouts:
                         raise RuntimeError(f"base {instr.base} is not a struct for field get")
                     layout = struct_layouts[inner_ty.name]
-                    if instr.field not in layout.index_by_name:
+                    idx = layout.index_by_name.get(instr.field)
+                    if idx is None:
                         raise RuntimeError(f"struct {inner_ty.name} has no field {instr.field}")
                     base_ptr = values.get(instr.base) if isinstance(base_ty, ReferenceType) else struct_slots.get(instr.base)
                     if base_ptr is None:
                         base_ptr = values.get(instr.base)
                     if base_ptr is None:
                         raise RuntimeError(f"no struct slot for {instr.base}")
-                    idx = layout.index_by_name[instr.field]
                     if isinstance(base_ptr.type, ir.LiteralStructType):
                         loaded = builder.extract_value(base_ptr, idx, name=instr.dest)
                         values[instr.dest] = loaded
@@ -838,7 +941,7 @@ def emit_module_object(
                     loaded = builder.load(field_ptr, name=instr.dest)
                     values[instr.dest] = loaded
                     ssa_types[instr.dest] = layout.field_types[idx]
-                elif isinstance(instr, mir.Unary):
+                elif kind is mir.Unary:
                     operand = values[instr.operand]
                     if instr.op == "not":
                         if not isinstance(operand.type, ir.IntType) or operand.type.width != 1:
@@ -855,7 +958,7 @@ def emit_module_object(
                         ssa_types[instr.dest] = ssa_types.get(instr.operand, BOOL)
                     else:
                         raise RuntimeError(f"unsupported unary op {instr.op}")
-                elif isinstance(instr, mir.ArrayLen):
+                elif kind is mir.ArrayLen:
                     arr_ty = ssa_types.get(instr.base)
                     if arr_ty is None or array_element_type(arr_ty) is None:
                         raise RuntimeError(f"base {instr.base} is not an array for len")
@@ -869,7 +972,7 @@ def emit_module_object(
                         len_val = builder.load(field_ptr, name=instr.dest)
                     values[instr.dest] = len_val
                     ssa_types[instr.dest] = WORD_INT
-                elif isinstance(instr, mir.ArrayGet):
+                elif kind is mir.ArrayGet:
                     arr_ty = ssa_types.get(instr.base)
                     elem_ty = array_element_type(arr_ty) if arr_ty else None
                     if elem_ty is None:
@@ -886,7 +989,7 @@ def emit_module_object(
                     loaded = builder.load(elem_ptr, name=instr.dest)
                     values[instr.dest] = loaded
                     ssa_types[instr.dest] = elem_ty
-                elif isinstance(instr, mir.ArraySet):
+                elif kind is mir.ArraySet:
                     arr_ty = ssa_types.get(instr.base)
                     elem_ty = array_element_type(arr_ty) if arr_ty else None
                     if elem_ty is None:
@@ -900,7 +1003,7 @@ def emit_module_object(
                     idx_val = values[instr.index]
                     elem_ptr = builder.gep(data_ptr, [idx_val], inbounds=True)
                     builder.store(values[instr.value], elem_ptr)
-                elif isinstance(instr, mir.ArrayLiteral):
+                elif kind is mir.ArrayLiteral:
                     # Stack-allocate array elements and build a {len, data*} struct.
                     elem_ty = instr.elem_type
                     try:
@@ -917,7 +1020,7 @@ def emit_module_object(
                     arr_val = builder.insert_value(arr_tmp, data_buf, 1)
                     values[instr.dest] = arr_val
                     ssa_types[instr.dest] = array_of(elem_ty)
-                elif isinstance(instr, mir.ErrorEvent):
+                elif kind is mir.ErrorEvent:
                     # Projection of error event: for the dummy runtime, call helper to get code as Int.
                     if instr.error not in values:
                         raise RuntimeError(f"error value {instr.error} undefined")
@@ -934,16 +1037,16 @@ def emit_module_object(
                     raise RuntimeError(f"unsupported instruction {instr}")
 
             term = block.terminator
-            if isinstance(term, mir.Return):
-                if f.name in can_error_funcs:
-                    ret_ll_ty = _llvm_type_with_structs(f.return_type)
+            term_kind = type(term)
+            if term_kind is mir.Return:
+                if fn_can_error:
                     if term.error is None:
                         err_val = ir.Constant(ERROR_PTR_TY, None)
                     else:
                         if term.error not in values:
                             raise RuntimeError(f"error value {term.error} undefined in {f.name}")
                         err_val = values[term.error]
-                    if isinstance(ret_ll_ty, ir.VoidType):
+                    if fn_ret_is_void:
                         builder.ret(err_val)
                     else:
                         if term.value is None:
@@ -954,8 +1057,7 @@ def emit_module_object(
                         # Unwrap references for return values.
                         if isinstance(ssa_types.get(term.value), ReferenceType) and isinstance(val_ll.type, ir.PointerType):
                             val_ll = builder.load(val_ll)
-                        pair_ty = llvm_ret_with_error(f.return_type)
-                        pair_ptr = builder.alloca(pair_ty, name=f"{f.name}_ret_pair")
+                        pair_ptr = builder.alloca(fn_ret_pair_ty, name=f"{f.name}_ret_pair")
                         val_ptr = builder.gep(pair_ptr, [I32_TY(0), I32_TY(0)], inbounds=True)
                         builder.store(val_ll, val_ptr)
                         err_ptr = builder.gep(pair_ptr, [I32_TY(0), I32_TY(1)], inbounds=True)
@@ -963,7 +1065,7 @@ def emit_module_object(
                         pair_loaded = builder.load(pair_ptr)
                         builder.ret(pair_loaded)
                 else:
-                    if isinstance(_llvm_type_with_structs(f.return_type), ir.VoidType):
+                    if fn_ret_is_void:
                         builder.ret_void()
                     else:
                         if term.value is None:
@@ -973,12 +1075,11 @@ def emit_module_object(
                         ret_val = values[term.value]
                         if isinstance(ssa_types.get(term.value), ReferenceType) and isinstance(ret_val.type, ir.PointerType):
                             ret_val = builder.load(ret_val)
-                        ret_ll_ty = _llvm_type_with_structs(f.return_type)
-                        if isinstance(ret_ll_ty, ir.LiteralStructType) and isinstance(ret_val.type, ir.PointerType):
-                            if ret_val.type.pointee == ret_ll_ty:
+                        if isinstance(fn_ret_ll_ty, ir.LiteralStructType) and isinstance(ret_val.type, ir.PointerType):
+                            if ret_val.type.pointee == fn_ret_ll_ty:
                                 ret_val = builder.load(ret_val)
                         builder.ret(ret_val)
-            elif isinstance(term, mir.Call):
+            elif term_kind is mir.Call:
                 if not (term.normal and term.error):
                     raise RuntimeError("call terminator without normal/error edges not supported")
                 callee = fn_map.get(term.callee)
@@ -1039,35 +1140,32 @@ def emit_module_object(
                     raise RuntimeError(f"edge to {norm_tgt} has arity {len(term.normal.args)} expected {len(norm_block.params)}")
                 if len(term.error.args) != len(err_block.params):
                     raise RuntimeError(f"edge to {err_tgt} has arity {len(term.error.args)} expected {len(err_block.params)}")
-                for param, arg in zip(norm_block.params, term.normal.args):
+                for phi, arg in zip(phis[norm_tgt], term.normal.args):
                     incoming_val = values[arg]
-                    phi = phis[(norm_tgt, param.name)]
                     expected_ty = phi.type.pointee if isinstance(phi.type, ir.PointerType) else phi.type
                     if isinstance(expected_ty, ir.LiteralStructType) and isinstance(incoming_val.type, ir.PointerType):
                         incoming_val = builder.load(incoming_val)
-                    phis[(norm_tgt, param.name)].add_incoming(incoming_val, blocks_map[(f.name, bname)])
-                for param, arg in zip(err_block.params, term.error.args):
+                    phi.add_incoming(incoming_val, cur_block)
+                for phi, arg in zip(phis[err_tgt], term.error.args):
                     incoming_val = values[arg]
-                    phi = phis[(err_tgt, param.name)]
                     expected_ty = phi.type.pointee if isinstance(phi.type, ir.PointerType) else phi.type
                     if isinstance(expected_ty, ir.LiteralStructType) and isinstance(incoming_val.type, ir.PointerType):
                         incoming_val = builder.load(incoming_val)
-                    phis[(err_tgt, param.name)].add_incoming(incoming_val, blocks_map[(f.name, bname)])
-                builder.cbranch(cond_val, blocks_map[(f.name, err_tgt)], blocks_map[(f.name, norm_tgt)])
-            elif isinstance(term, mir.Br):
+                    phi.add_incoming(incoming_val, cur_block)
+                builder.cbranch(cond_val, fblocks[err_tgt], fblocks[norm_tgt])
+            elif term_kind is mir.Br:
                 tgt = term.target.target
                 tblock = f.blocks[tgt]
                 if len(term.target.args) != len(tblock.params):
                     raise RuntimeError(f"edge to {tgt} has arity {len(term.target.args)} expected {len(tblock.params)}")
-                for param, arg in zip(tblock.params, term.target.args):
+                for phi, arg in zip(phis[tgt], term.target.args):
                     incoming_val = values[arg]
-                    phi = phis[(tgt, param.name)]
                     expected_ty = phi.type.pointee if isinstance(phi.type, ir.PointerType) else phi.type
                     if isinstance(expected_ty, ir.LiteralStructType) and isinstance(incoming_val.type, ir.PointerType):
                         incoming_val = builder.load(incoming_val)
-                    phis[(tgt, param.name)].add_incoming(incoming_val, blocks_map[(f.name, bname)])
-                builder.branch(blocks_map[(f.name, tgt)])
-            elif isinstance(term, mir.CondBr):
+                    phi.add_incoming(incoming_val, cur_block)
+                builder.branch(fblocks[tgt])
+            elif term_kind is mir.CondBr:
                 if term.cond not in values:
                     raise RuntimeError(f"cond value {term.cond} undefined")
                 cond_val = values[term.cond]
@@ -1080,27 +1178,26 @@ def emit_module_object(
                         raise RuntimeError(
                             f"edge to {tgt} has arity {len(edge.args)} expected {len(tblock.params)}"
                         )
-                    for param, arg in zip(tblock.params, edge.args):
+                    for param, arg, phi in zip(tblock.params, edge.args, phis[tgt]):
                         incoming_val = values[arg]
-                        phi = phis[(tgt, param.name)]
                         expected_ty = phi.type.pointee if isinstance(phi.type, ir.PointerType) else phi.type
                         # Only load pointers for value params; reference params expect the pointer.
                         if not isinstance(param.type, ReferenceType) and isinstance(expected_ty, ir.LiteralStructType) and isinstance(incoming_val.type, ir.PointerType):
                             incoming_val = builder.load(incoming_val)
-                        phis[(tgt, param.name)].add_incoming(incoming_val, blocks_map[(f.name, bname)])
-                builder.cbranch(cond_val, blocks_map[(f.name, term.then.target)], blocks_map[(f.name, term.els.target)])
-            elif isinstance(term, mir.Throw):
-                if f.name not in can_error_funcs:
+                        phi.add_incoming(incoming_val, cur_block)
+                builder.cbranch(cond_val, fblocks[term.then.target], fblocks[term.els.target])
+            elif term_kind is mir.Throw:
+                if not fn_can_error:
                     raise RuntimeError(f"throw in non-error function {f.name} not supported")
                 if term.error not in values:
                     raise RuntimeError(f"throw error value {term.error} undefined in {f.name}")
                 err_val = values[term.error]
-                ret_ll_ty = _llvm_type_with_structs(f.return_type)
-                if isinstance(ret_ll_ty, ir.VoidType):
+                ret_ll_ty = fn_ret_ll_ty
+                if fn_ret_is_void:
                     builder.ret(err_val)
                 else:
                     # Value is ignored on error; return a zeroed pair with the error.
-                    pair_ty = llvm_ret_with_error(f.return_type)
+                    pair_ty = fn_ret_pair_ty
                     if isinstance(ret_ll_ty, ir.IntType):
                         val_zero = ret_ll_ty(0)
                     elif isinstance(ret_ll_ty, ir.PointerType):
@@ -1129,14 +1226,12 @@ def emit_module_object(
                 raise RuntimeError(f"unsupported terminator {term}")
 
     # Debugging aid: print module if LLVM rejects it.
-    target = llvm.Target.from_default_triple()
-    tm = target.create_target_machine()
+    ir_text = str(mod)
     try:
-        llvm_mod = llvm.parse_assembly(str(mod))
+        obj = _object_for_ir(ir_text)
     except RuntimeError as e:
         # Debug aid: dump module on parse failure.
-        print(mod, file=sys.stderr)
+        print(ir_text, file=sys.stderr)
         raise
-    obj = tm.emit_object(llvm_mod)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_bytes(obj)
@@ -13,7 +13,7 @@ from typing import Dict, Iterable, Optional
 from .types import Type
 
 
-@dataclass
+@dataclass(slots=True)
 class SSAContext:
     """Function-global SSA state (shared across block envs)."""
 
@@ -23,7 +23,7 @@ class SSAContext:
     addr_slots: set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class SSAEnv:
     """Per-block SSA environment, sharing a function-global context.
 
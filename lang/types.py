@@ -6,7 +6,7 @@ from typing import Dict, Optional, Tuple
 from .ast import TypeExpr
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Type:
     name: str
     args: Tuple["Type", ...] = ()
@@ -18,7 +18,7 @@ class Type:
         return f"{self.name}[{inner}]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReferenceType(Type):
     mutable: bool = False
 
@@ -60,31 +60,45 @@ _ALIAS_HINTS = {
 }
 
 _DISPLAYABLE_PRIMITIVES = frozenset({I64, F64, BOOL, STR, ERROR})
+# Names of the above; str hashes are cached, Type hashes are recomputed per lookup.
+_DISPLAYABLE_NAMES = frozenset(t.name for t in _DISPLAYABLE_PRIMITIVES)
 
 
 def is_displayable(ty: Type) -> bool:
-    return ty in _DISPLAYABLE_PRIMITIVES
+    # Same answer as `ty in _DISPLAYABLE_PRIMITIVES`: equal Types share class, name and args.
+    return type(ty) is Type and not ty.args and ty.name in _DISPLAYABLE_NAMES
+
+
+# Canonical instance per resolved type. Equality stays structural; sharing
+# instances lets `is` short-circuit comparisons and avoids duplicate objects.
+_INTERNED: Dict[Type, Type] = {}
+
+
+def _intern(ty: Type) -> Type:
+    return _INTERNED.setdefault(ty, ty)
 
 
 def resolve_type(type_expr: TypeExpr) -> Type:
+    if not type_expr.args:
+        # Common case: a bare primitive name resolves with one lookup.
+        builtin = _PRIMITIVES.get(type_expr.name)
+        if builtin is not None:
+            return builtin
     if type_expr.name == "&":
         inner = resolve_type(type_expr.args[0])
-        return ReferenceType(name="&", args=(inner,), mutable=False)
+        return _intern(ReferenceType(name="&", args=(inner,), mutable=False))
     if type_expr.name == "&mut":
         inner = resolve_type(type_expr.args[0])
-        return ReferenceType(name="&mut", args=(inner,), mutable=True)
+        return _intern(ReferenceType(name="&mut", args=(inner,), mutable=True))
     if type_expr.args:
         resolved_args = tuple(resolve_type(arg) for arg in type_expr.args)
-        return Type(type_expr.name, resolved_args)
+        return _intern(Type(type_expr.name, resolved_args))
     alias_hint = _ALIAS_HINTS.get(type_expr.name)
     if alias_hint:
         raise TypeSystemError(
             f"Type '{type_expr.name}' is not defined. Use '{alias_hint}' instead."
         )
-    builtin = _PRIMITIVES.get(type_expr.name)
-    if builtin:
-        return builtin
-    return Type(type_expr.name)
+    return _intern(Type(type_expr.name))
 
 
 @dataclass(frozen=True)
@@ -95,13 +109,19 @@ class FunctionSignature:
     effects: Optional[frozenset[str]]
     allowed_kwargs: frozenset[str] = frozenset()
 
+    def __post_init__(self) -> None:
+        # Callers may hand in any iterable; keyword checks rely on hashed membership.
+        if not isinstance(self.allowed_kwargs, frozenset):
+            object.__setattr__(self, "allowed_kwargs", frozenset(self.allowed_kwargs))
+
 
 class TypeSystemError(Exception):
     pass
 
 
 def array_of(inner: Type) -> Type:
-    return Type("Array", (inner,))
+    # Canonical instance per element type, shared with resolve_type's.
+    return _intern(Type("Array", (inner,)))
 
 
 def array_element_type(array_type: Type) -> Optional[Type]:
@@ -116,4 +136,4 @@ def array_element_type(array_type: Type) -> Optional[Type]:
 
 
 def ref_of(inner: Type, mutable: bool = False) -> ReferenceType:
-    return ReferenceType(name="&mut" if mutable else "&", args=(inner,), mutable=mutable)
+    return _intern(ReferenceType(name="&mut" if mutable else "&", args=(inner,), mutable=mutable))
@@ -20,7 +20,7 @@ and validate catch-arm shapes when provided.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Callable, FrozenSet, Mapping, Sequence, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Callable, FrozenSet, Mapping, Sequence, Tuple
 
 from lang2.driftc.core.diagnostics import Diagnostic
 from lang2.driftc.core.span import Span
@@ -28,12 +28,10 @@ from lang2.driftc.core.types_protocol import TypeEnv
 from lang2.driftc.checker.catch_arms import CatchArmInfo, validate_catch_arms
 from lang2.driftc.core.type_resolve_common import resolve_opaque_type
 from lang2.driftc.core.types_core import TypeTable, TypeId, TypeKind, TypeParamId
+from lang2.driftc import stage1 as H
 from lang2.driftc.stage1.hir_utils import collect_catch_arms_from_block
 from lang2.driftc.stage1.normalize import normalize_hir
 
-if TYPE_CHECKING:
-	from lang2.driftc import stage1 as H
-
 
 @dataclass(frozen=True)
 class TypeParam:
@@ -44,7 +42,7 @@ class TypeParam:
 	span: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FnSignature:
 	"""
 	Placeholder function signature used by the stub checker.
@@ -83,6 +81,8 @@ class FnSignature:
 	# Legacy/raw fields (to be removed once real type checker is wired).
 	return_type: Any = None
 	throws_events: Tuple[str, ...] = ()
+	# `frozenset(throws_events)`, filled in by the checker on first use.
+	declared_events_frozen: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
 	param_types: Optional[list[Any]] = None  # raw param type shapes (strings/tuples)
 	module: Optional[str] = None
 	# Module interface marker (Milestone 3): exported functions form an ABI boundary.
@@ -91,7 +91,7 @@ class FnSignature:
 	is_exported_entrypoint: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FnInfo:
 	"""
 	Per-function checker metadata (placeholder).
@@ -116,7 +116,7 @@ class FnInfo:
 	error_type_id: Optional[TypeId] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckedProgram:
 	"""
 	Container returned by the checker.
@@ -162,6 +162,9 @@ class Checker:
 		self._signatures = signatures or {}
 		self._catch_arms = self._normalize_and_collect_catch_arms(hir_blocks or {})
 		self._exception_catalog = dict(exception_catalog) if exception_catalog else None
+		# Catch-arm validation only tests membership; the catalog is fixed for the
+		# checker's lifetime, so its event names are collected once.
+		self._known_events: FrozenSet[str] = frozenset(self._exception_catalog) if self._exception_catalog else frozenset()
 		self._hir_blocks = hir_blocks or {}
 		# Use shared TypeTable when supplied; otherwise create a local one.
 		self._type_table = type_table or TypeTable()
@@ -191,6 +194,10 @@ class Checker:
 		self._void_type = _find_named(TypeKind.VOID, "Void") or self._type_table.ensure_void()
 		self._error_type = _find_named(TypeKind.ERROR, "Error") or self._type_table.ensure_error()
 		self._unknown_type = _find_named(TypeKind.UNKNOWN, "Unknown") or self._type_table.ensure_unknown()
+		# Legacy signature shapes repeat heavily ("Int", ("FnResult", ok, err), ...);
+		# memoize their resolution so each shape mints its TypeIds once.
+		self._resolve_cache: dict[Any, tuple[Optional[TypeId], Optional[TypeId]]] = {}
+		self._opaque_cache: dict[Any, TypeId] = {}
 		# TODO: remove declared_can_throw shim once real parser/type checker supplies signatures.
 
 	def _normalize_and_collect_catch_arms(self, hir_blocks: Mapping[str, "H.HBlock"]) -> dict[str, list[list[CatchArmInfo]]]:
@@ -217,112 +224,117 @@ class Checker:
 		"""
 		fn_infos: Dict[str, FnInfo] = {}
 		diagnostics: List[Diagnostic] = []
-		known_events: Set[str] = set(self._exception_catalog.keys()) if self._exception_catalog else set()
-
-		for name in fn_decls:
-			declared_can_throw = self._declared_map.get(name)
-			sig = self._signatures.get(name)
-			declared_events: Optional[FrozenSet[str]] = None
-			return_type = None
-			return_type_id: Optional[TypeId] = None
-			error_type_id: Optional[TypeId] = None
-
-			if sig is not None:
-				declared_events = frozenset(sig.throws_events) if sig.throws_events else None
-
-				# Prefer pre-resolved TypeIds if supplied; fall back to legacy resolution.
-				return_type_id = sig.return_type_id
-				error_type_id = sig.error_type_id
-				if return_type_id is None:
-					return_type_id, error_type_id = self._resolve_signature_types(sig)
-					sig.return_type_id = return_type_id
-					sig.error_type_id = error_type_id
-				elif error_type_id is None:
-					# If the signature already carries a FnResult TypeId, derive the error side.
-					td = self._type_table.get(return_type_id)
-					if td.kind is TypeKind.FNRESULT and len(td.param_types) >= 2:
-						error_type_id = td.param_types[1]
-						sig.error_type_id = error_type_id
 
-				if sig.param_type_ids is None:
-					sig.param_type_ids = self._resolve_param_types(sig)
-
-				# Keep legacy/raw fields for backward compatibility.
-				return_type = sig.return_type
-				if declared_events is None and sig.throws_events:
-					declared_events = frozenset(sig.throws_events)
-				if sig.declared_can_throw is None and sig.throws_events:
-					sig.declared_can_throw = True
-				# Legacy shim: an explicit bool map overrides signatures in tests.
-				if declared_can_throw is None and sig.declared_can_throw is not None:
-					declared_can_throw = sig.declared_can_throw
-
-			if declared_can_throw is None:
-				# Unspecified throw effect: default to non-throwing here and let the
-				# inference pass below compute the actual can-throw ABI based on HIR.
+		if not self._signatures and not self._catch_arms:
+			# Legacy shim callers pass only `declared_can_throw`: there is no
+			# signature to resolve or catch arm to validate for any name.
+			declared_map = self._declared_map
+			fn_infos = {name: FnInfo(name, declared_map.get(name) or False) for name in fn_decls}
+		else:
+			for name in fn_decls:
+				declared_can_throw = self._declared_map.get(name)
+				sig = self._signatures.get(name)
+				declared_events: Optional[FrozenSet[str]] = None
+				return_type = None
+				return_type_id: Optional[TypeId] = None
+				error_type_id: Optional[TypeId] = None
+
+				if sig is not None:
+					declared_events = sig.declared_events_frozen
+					if declared_events is None and sig.throws_events:
+						declared_events = sig.declared_events_frozen = frozenset(sig.throws_events)
+
+					# Prefer pre-resolved TypeIds if supplied; fall back to legacy resolution.
+					return_type_id = sig.return_type_id
+					error_type_id = sig.error_type_id
+					if return_type_id is None:
+						return_type_id, error_type_id = self._resolve_signature_types(sig)
+						sig.return_type_id = return_type_id
+						sig.error_type_id = error_type_id
+					elif error_type_id is None:
+						# If the signature already carries a FnResult TypeId, derive the error side.
+						td = self._type_table.get(return_type_id)
+						if td.kind is TypeKind.FNRESULT and len(td.param_types) >= 2:
+							error_type_id = td.param_types[1]
+							sig.error_type_id = error_type_id
+
+					if sig.param_type_ids is None:
+						sig.param_type_ids = self._resolve_param_types(sig)
+
+					# Keep legacy/raw fields for backward compatibility.
+					return_type = sig.return_type
+					if sig.declared_can_throw is None and sig.throws_events:
+						sig.declared_can_throw = True
+					# Legacy shim: an explicit bool map overrides signatures in tests.
+					if declared_can_throw is None and sig.declared_can_throw is not None:
+						declared_can_throw = sig.declared_can_throw
+
+				if declared_can_throw is None:
+					# Unspecified throw effect: default to non-throwing here and let the
+					# inference pass below compute the actual can-throw ABI based on HIR.
+					#
+					# Note: `FnResult` is not a surface-level type in lang2; it is an
+					# internal ABI carrier. Therefore, the signature return type does not
+					# imply can-throw.
+					declared_can_throw = False
+
+				# Method receiver validation (spec §3.8).
 				#
-				# Note: `FnResult` is not a surface-level type in lang2; it is an
-				# internal ABI carrier. Therefore, the signature return type does not
-				# imply can-throw.
-				declared_can_throw = False
-
-			# Method receiver validation (spec §3.8).
-			#
-			# For production correctness, method receiver conventions are validated
-			# in the checker (typecheck phase), not during parsing.
-			if sig is not None and sig.is_method:
-				# Receiver name: methods must declare a receiver parameter named `self`
-				# as their first parameter.
-				if not sig.param_names:
-					diagnostics.append(
-						Diagnostic(
-							message=f"method '{sig.method_name or sig.name}' must declare a receiver parameter 'self'",
-							severity="error",
-							span=Span.from_loc(getattr(sig, "loc", None)),
-						)
-					)
-				elif sig.param_names[0] != "self":
-					diagnostics.append(
-						Diagnostic(
-							message=f"first parameter of method '{sig.method_name or sig.name}' must be named 'self'",
-							severity="error",
-							span=Span.from_loc(getattr(sig, "loc", None)),
+				# For production correctness, method receiver conventions are validated
+				# in the checker (typecheck phase), not during parsing.
+				if sig is not None and sig.is_method:
+					# Receiver name: methods must declare a receiver parameter named `self`
+					# as their first parameter.
+					if not sig.param_names:
+						diagnostics.append(
+							Diagnostic(
+								message=f"method '{sig.method_name or sig.name}' must declare a receiver parameter 'self'",
+								severity="error",
+								span=Span.from_loc(getattr(sig, "loc", None)),
+							)
 						)
-					)
-				# Receiver type must match the impl target type according to self_mode.
-				if sig.param_type_ids and sig.impl_target_type_id is not None and sig.self_mode is not None:
-					recv_ty = sig.param_type_ids[0]
-					expected: TypeId | None = None
-					if sig.self_mode == "value":
-						expected = sig.impl_target_type_id
-					elif sig.self_mode == "ref":
-						expected = self._type_table.ensure_ref(sig.impl_target_type_id)
-					elif sig.self_mode == "ref_mut":
-						expected = self._type_table.ensure_ref_mut(sig.impl_target_type_id)
-					if expected is not None and recv_ty != expected:
-						target_name = self._type_table.get(sig.impl_target_type_id).name
+					elif sig.param_names[0] != "self":
 						diagnostics.append(
 							Diagnostic(
-								message=f"receiver type for method '{sig.method_name or sig.name}' must be '{target_name}' (or '&{target_name}' / '&mut {target_name}')",
+								message=f"first parameter of method '{sig.method_name or sig.name}' must be named 'self'",
 								severity="error",
 								span=Span.from_loc(getattr(sig, "loc", None)),
 							)
 						)
+					# Receiver type must match the impl target type according to self_mode.
+					if sig.param_type_ids and sig.impl_target_type_id is not None and sig.self_mode is not None:
+						recv_ty = sig.param_type_ids[0]
+						expected: TypeId | None = None
+						if sig.self_mode == "value":
+							expected = sig.impl_target_type_id
+						elif sig.self_mode == "ref":
+							expected = self._type_table.ensure_ref(sig.impl_target_type_id)
+						elif sig.self_mode == "ref_mut":
+							expected = self._type_table.ensure_ref_mut(sig.impl_target_type_id)
+						if expected is not None and recv_ty != expected:
+							target_name = self._type_table.get(sig.impl_target_type_id).name
+							diagnostics.append(
+								Diagnostic(
+									message=f"receiver type for method '{sig.method_name or sig.name}' must be '{target_name}' (or '&{target_name}' / '&mut {target_name}')",
+									severity="error",
+									span=Span.from_loc(getattr(sig, "loc", None)),
+								)
+							)
 
-			catch_arms_groups = self._catch_arms.get(name)
-			if catch_arms_groups is not None:
-				for arms in catch_arms_groups:
-					validate_catch_arms(arms, known_events, diagnostics)
-
-			fn_infos[name] = FnInfo(
-				name=name,
-				declared_can_throw=declared_can_throw,
-				signature=sig,
-				declared_events=declared_events,
-				return_type=return_type,  # legacy/raw
-				return_type_id=return_type_id,
-				error_type_id=error_type_id,
-			)
+				catch_arms_groups = self._catch_arms.get(name)
+				if catch_arms_groups is not None:
+					for arms in catch_arms_groups:
+						validate_catch_arms(arms, self._known_events, diagnostics)
+
+				fn_infos[name] = FnInfo(
+					name=name,
+					declared_can_throw=declared_can_throw,
+					signature=sig,
+					declared_events=declared_events,
+					return_type=return_type,  # legacy/raw
+					return_type_id=return_type_id,
+					error_type_id=error_type_id,
+				)
 
 		# TODO: real checker will:
 		#   - resolve signatures (FnResult/throws),
@@ -450,7 +462,6 @@ class Checker:
 		still conservative but now accounts for try/catch coverage when the thrown
 		exception is an `HExceptionInit` that matches a catch arm (or a catch-all).
 		"""
-		from lang2.driftc import stage1 as H
 		may_throw = False
 		first_span: Span | None = None
 
@@ -668,8 +679,6 @@ class Checker:
 
 			Everything else returns `None` to avoid guessing.
 			"""
-			from lang2.driftc import stage1 as H
-
 			checker = self.checker
 			bitwise_ops = {
 				H.BinaryOp.BIT_AND,
@@ -1155,8 +1164,6 @@ class Checker:
 		calls, Result.Ok in a FnResult-returning function). Full expression
 		typing is still deferred.
 		"""
-		from lang2.driftc import stage1 as H
-
 		def walk_expr(expr: H.HExpr) -> None:
 			if isinstance(expr, H.HCall) and isinstance(expr.fn, H.HVar):
 				callee_info = fn_infos.get(expr.fn.name)
@@ -1304,9 +1311,9 @@ class Checker:
 		* strings containing 'FnResult'
 		* tuples shaped like ('FnResult', ok_ty, err_ty)
 		"""
-		if isinstance(return_type, str):
+		if type(return_type) is str:
 			return "FnResult" in return_type
-		if isinstance(return_type, tuple) and return_type and return_type[0] == "FnResult":
+		if type(return_type) is tuple and return_type and return_type[0] == "FnResult":
 			return True
 		return False
 
@@ -1319,8 +1326,25 @@ class Checker:
 		- tuple ('FnResult', ok, err) -> FnResult of naive ok/err mapping
 		- strings 'Int'/'Bool' -> scalar types
 		- fallback: Unknown
+
+		Results for string/tuple shapes are memoized per checker, except those
+		that mention Unknown (a later declaration may make them resolvable).
 		"""
 		rt = sig.return_type
+		if type(rt) is str or type(rt) is tuple:
+			try:
+				cached = self._resolve_cache.get(rt)
+			except TypeError:
+				return self._resolve_return_shape(rt)
+			if cached is None:
+				cached = self._resolve_return_shape(rt)
+				if cached[0] is None or not self._mentions_unknown(cached[0]):
+					self._resolve_cache[rt] = cached
+			return cached
+		return self._resolve_return_shape(rt)
+
+	def _resolve_return_shape(self, rt: Any) -> tuple[Optional[TypeId], Optional[TypeId]]:
+		"""Uncached body of `_resolve_signature_types`."""
 		if isinstance(rt, str):
 			if "FnResult" in rt:
 				return self._type_table.new_fnresult(self._int_type, self._error_type), self._error_type
@@ -1364,10 +1388,32 @@ class Checker:
 		consistent across the compiler. The only local heuristic we retain is
 		treating any string containing "Error" as the builtin error type, which
 		matches legacy test fixtures.
+
+		Results are memoized per checker unless they mention Unknown: e.g.
+		`Optional<Int>` resolves to Unknown until lang.core's Optional is declared.
 		"""
-		if isinstance(val, str) and "Error" in val:
-			return self._error_type
-		return resolve_opaque_type(val, self._type_table)
+		val_kind = type(val)
+		if val_kind is not str and val_kind is not tuple:
+			return resolve_opaque_type(val, self._type_table)
+		try:
+			cached = self._opaque_cache.get(val)
+		except TypeError:
+			return resolve_opaque_type(val, self._type_table)
+		if cached is None:
+			if val_kind is str and "Error" in val:
+				cached = self._error_type
+			else:
+				cached = resolve_opaque_type(val, self._type_table)
+			if not self._mentions_unknown(cached):
+				self._opaque_cache[val] = cached
+		return cached
+
+	def _mentions_unknown(self, ty: TypeId) -> bool:
+		"""True when `ty` is Unknown or has an Unknown anywhere in its type arguments."""
+		td = self._type_table.get(ty)
+		if td.kind is TypeKind.UNKNOWN:
+			return True
+		return any(self._mentions_unknown(p) for p in td.param_types)
 
 	def _resolve_typeexpr(self, raw: object, *, module_id: str | None = None) -> TypeId:
 		"""
@@ -1399,8 +1445,6 @@ class Checker:
 		mutations (let/assign) are centralized and every validation sees a
 		consistent environment.
 		"""
-		from lang2.driftc import stage1 as H
-
 		def walk_expr(expr: H.HExpr) -> None:
 			# Run inference for all expressions up front so shared diagnostics fire
 			# even when no specific validator hook is registered for that node.
@@ -1563,8 +1607,6 @@ class Checker:
 		owner of that normalization so the pipeline stays robust even before the
 		full typed checker is the only frontend.
 		"""
-		from lang2.driftc import stage1 as H
-
 		if not (hasattr(H, "HMatchExpr") and isinstance(expr, getattr(H, "HMatchExpr"))):
 			return
 
@@ -1727,8 +1769,6 @@ class Checker:
 
 	def _array_validator_on_expr(self, expr: "H.HExpr", ctx: "_TypingContext") -> None:
 		"""Trigger array literal/index inference to surface diagnostics."""
-		from lang2.driftc import stage1 as H
-
 		if isinstance(expr, (H.HArrayLiteral, H.HIndex)):
 			ctx.infer(expr)
 
@@ -1738,8 +1778,6 @@ class Checker:
 
 		MVP rule: `~`, `&`, `|`, `^`, `<<`, `>>` require `Uint` operands.
 		"""
-		from lang2.driftc import stage1 as H
-
 		uint_ty = self._uint_type
 
 		if isinstance(expr, H.HUnary) and expr.op is H.UnaryOp.BIT_NOT:
@@ -1780,8 +1818,6 @@ class Checker:
 		Expression statements are allowed to discard Void-returning calls; that
 		expr-stmt special-case is enforced in the statement validator.
 		"""
-		from lang2.driftc import stage1 as H
-
 		def is_void(tid: TypeId | None) -> bool:
 			return tid is not None and self._type_table.is_void(tid)
 
@@ -1885,8 +1921,6 @@ class Checker:
 
 	def _bool_validator_on_stmt(self, stmt: "H.HStmt", ctx: "_TypingContext") -> None:
 		"""Require Boolean conditions when the type is known."""
-		from lang2.driftc import stage1 as H
-
 		if isinstance(stmt, H.HIf):
 			cond_ty = ctx.infer(stmt.cond)
 			if cond_ty is not None and cond_ty != self._bool_type:
@@ -1905,8 +1939,6 @@ class Checker:
 		- Non-void return type: must return a value.
 		- Void cannot be stored in let/assign or declared explicitly.
 		"""
-		from lang2.driftc import stage1 as H
-
 		def is_void(tid: TypeId | None) -> bool:
 			return tid is not None and self._type_table.is_void(tid)
 
@@ -1985,7 +2017,6 @@ class Checker:
 		- exception field values must be DiagnosticValue or primitive literals
 		  (Int/Bool/String) that the compiler can auto-wrap into DiagnosticValue.
 		"""
-		from lang2.driftc import stage1 as H
 		from lang2.driftc.core.exception_ctor_args import KwArg as _KwArg, resolve_exception_ctor_args
 
 		schemas: dict[str, tuple[str, list[str]]] = getattr(self._type_table, "exception_schemas", {})
@@ -2081,7 +2112,6 @@ class Checker:
 			AddrOfLocal,
 			AddrOfField,
 			LoadRef,
-			StoreRef,
 			ConstructStruct,
 			StructGetField,
 			ConstructVariant,
@@ -2099,6 +2129,7 @@ class Checker:
 			ConstructError,
 			AssignSSA,
 			Phi,
+			Return,
 			UnaryOpInstr,
 			BinaryOpInstr,
 			ArrayLit,
@@ -2122,6 +2153,180 @@ class Checker:
 			except KeyError:
 				return False
 
+		# Per-instruction typing rules, dispatched on the exact MIR node class.
+		# Each handler returns the TypeId for `dest`, or None to leave it alone;
+		# the caller records the type and tracks whether anything changed.
+		DestHandler = Callable[[str, Any, str, Any], Optional[TypeId]]
+
+		def h_load_local(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Propagate local type to the load destination.
+			return value_types.get((fn_name, instr.local))
+
+		def h_addr_of_local(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Taking an address yields a reference type.
+			local_ty = value_types.get((fn_name, instr.local))
+			if local_ty is None:
+				return None
+			if getattr(instr, "is_mut", False):
+				return self._type_table.ensure_ref_mut(local_ty)
+			return self._type_table.ensure_ref(local_ty)
+
+		def h_addr_of_field(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Address-of field yields a reference to the field type.
+			if getattr(instr, "is_mut", False):
+				return self._type_table.ensure_ref_mut(instr.field_ty)
+			return self._type_table.ensure_ref(instr.field_ty)
+
+		def h_load_ref(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Deref load result type is the element TypeId carried by the MIR.
+			return instr.inner_ty
+
+		def h_variant(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Constructing a variant yields the declared variant TypeId.
+			return instr.variant_ty
+
+		def h_field_ty(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Field extraction (variant or struct) yields the field TypeId carried by the MIR.
+			return instr.field_ty
+
+		def h_uint(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Variant tags and string/array lengths are typed as Uint in v1.
+			return self._uint_type
+
+		def h_const_int(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return None if (fn_name, dest) in value_types else self._int_type
+
+		def h_const_bool(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return None if (fn_name, dest) in value_types else self._bool_type
+
+		def h_string(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return self._string_type
+
+		def h_array_index_load(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return instr.elem_ty
+
+		# `new_array` scans the whole table to reuse an existing Array<elem>; remember
+		# its answer per element type so repeated rounds do not rescan.
+		array_types: Dict[TypeId, TypeId] = {}
+
+		def h_array_lit(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			arr_ty = array_types.get(instr.elem_ty)
+			if arr_ty is None:
+				arr_ty = array_types[instr.elem_ty] = self._type_table.new_array(instr.elem_ty)
+			return arr_ty
+
+		def h_struct(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# Struct construction yields the nominal struct TypeId carried by MIR.
+			return instr.struct_ty
+
+		def h_result_ok(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			ok_ty = fn_return_parts[0] if fn_return_parts else ty_for(fn_name, instr.value)
+			err_ty = fn_return_parts[1] if fn_return_parts else self._error_type
+			return self._type_table.ensure_fnresult(ok_ty, err_ty)
+
+		def h_result_err(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			err_ty = ty_for(fn_name, instr.error)
+			ok_ty = fn_return_parts[0] if fn_return_parts else self._unknown_type
+			return self._type_table.ensure_fnresult(ok_ty, err_ty)
+
+		def h_error(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return self._error_type
+
+		def h_bool(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			# result.is_err() -> Bool
+			return self._bool_type
+
+		def h_result_part(index: int) -> DestHandler:
+			def handler(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+				res_def = self._type_table.get(ty_for(fn_name, instr.result))
+				if res_def.kind is TypeKind.FNRESULT:
+					return res_def.param_types[index]
+				return self._unknown_type
+
+			return handler
+
+		# A call's result type depends only on the callee, so compute it once per
+		# callee name rather than once per call site per round.
+		call_types: Dict[str, Optional[TypeId]] = {}
+
+		def h_call(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			if instr.fn in call_types:
+				return call_types[instr.fn]
+			dest_ty = call_types[instr.fn] = call_result_type(instr.fn)
+			return dest_ty
+
+		def call_result_type(callee: str) -> Optional[TypeId]:
+			callee_sig = signatures.get(callee)
+			if callee_sig is None:
+				return self._unknown_type
+			if callee_sig.return_type_id is None:
+				rt_id, err_id = self._resolve_signature_types(callee_sig)
+				callee_sig.return_type_id = rt_id
+				callee_sig.error_type_id = err_id
+			callee_can_throw = (
+				can_throw_by_name.get(callee, False)
+				if can_throw_by_name is not None
+				else bool(callee_sig.declared_can_throw)
+			)
+			if callee_can_throw:
+				ok_ty = callee_sig.return_type_id or self._unknown_type
+				err_ty = callee_sig.error_type_id or self._error_type
+				return self._type_table.ensure_fnresult(ok_ty, err_ty)
+			dest_ty = callee_sig.return_type_id or self._unknown_type
+			return None if is_void_tid(dest_ty) else dest_ty
+
+		def h_assign(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return value_types.get((fn_name, instr.src))
+
+		def h_unary(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			return ty_for(fn_name, instr.operand)
+
+		def h_binary(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			left_ty = ty_for(fn_name, instr.left)
+			right_ty = ty_for(fn_name, instr.right)
+			# If both operands agree, propagate that type; otherwise fall back to Unknown.
+			return left_ty if left_ty == right_ty else self._unknown_type
+
+		def h_phi(fn_name: str, instr: Any, dest: str, fn_return_parts: Any) -> Optional[TypeId]:
+			incoming = [value_types.get((fn_name, v)) for v in instr.incoming.values()]
+			incoming = [t for t in incoming if t is not None]
+			if incoming and all(t == incoming[0] for t in incoming):
+				return incoming[0]
+			return None
+
+		# StoreLocal writes a local rather than `dest` and is handled inline;
+		# StoreRef defines no value and needs no typing.
+		dest_handlers: Dict[type, DestHandler] = {
+			LoadLocal: h_load_local,
+			AddrOfLocal: h_addr_of_local,
+			AddrOfField: h_addr_of_field,
+			LoadRef: h_load_ref,
+			ConstructVariant: h_variant,
+			VariantTag: h_uint,
+			VariantGetField: h_field_ty,
+			ConstInt: h_const_int,
+			ConstBool: h_const_bool,
+			ConstString: h_string,
+			StringLen: h_uint,
+			ArrayLen: h_uint,
+			ArrayCap: h_uint,
+			ArrayIndexLoad: h_array_index_load,
+			ArrayLit: h_array_lit,
+			ConstructStruct: h_struct,
+			StructGetField: h_field_ty,
+			ConstructResultOk: h_result_ok,
+			ConstructResultErr: h_result_err,
+			ConstructError: h_error,
+			ResultIsErr: h_bool,
+			ResultOk: h_result_part(0),
+			ResultErr: h_result_part(1),
+			Call: h_call,
+			AssignSSA: h_assign,
+			UnaryOpInstr: h_unary,
+			BinaryOpInstr: h_binary,
+			Phi: h_phi,
+		}
+
 		# Seed parameter types from signatures when available so callers and returns
 		# see concrete types for params immediately.
 		for fn_name, ssa in ssa_funcs.items():
@@ -2131,264 +2336,83 @@ class Checker:
 					if ty_id is not None:
 						value_types[(fn_name, param_name)] = ty_id
 
-			changed = True
+		# Typing never crosses function boundaries: calls consult signatures, not
+		# the callee's SSA values. Each function therefore runs its own fixed point
+		# and stops as soon as a round over its blocks records nothing new.
+		for fn_name, ssa in ssa_funcs.items():
+			sig = signatures.get(fn_name)
+			if sig is not None and sig.return_type_id is None:
+				# Resolve up front (as `check` does) rather than waiting for a caller's
+				# Call to do it, so the result does not depend on function order.
+				sig.return_type_id, sig.error_type_id = self._resolve_signature_types(sig)
+			fn_return_parts: tuple[TypeId, TypeId] | None = None
+			fn_is_void = False
+
+			# Decide can-throw for typing purposes.
+			# - Prefer the checker-provided effective mapping when available.
+			# - Otherwise fall back to any explicit signature flag (legacy).
+			fn_is_can_throw = (
+				can_throw_by_name.get(fn_name, False)
+				if can_throw_by_name is not None
+				else bool(sig.declared_can_throw) if sig else False
+			)
+
+			if sig and sig.return_type_id is not None:
+				# Surface return type is `T`. If the function is can-throw, the
+				# internal ABI return is `FnResult<T, Error>`.
+				fn_is_void = self._type_table.is_void(sig.return_type_id)
+				if fn_is_can_throw:
+					fn_return_parts = (sig.return_type_id, sig.error_type_id or self._error_type)
+				else:
+					# Legacy: older tests used FnResult as a surface return type.
+					td = self._type_table.get(sig.return_type_id)
+					if td.kind is TypeKind.FNRESULT and len(td.param_types) == 2:
+						fn_return_parts = (td.param_types[0], td.param_types[1])
+
 			# Fixed-point with a small iteration cap.
 			for _ in range(5):
-				if not changed:
-					break
 				changed = False
-				for fn_name, ssa in ssa_funcs.items():
-					sig = signatures.get(fn_name)
-					fn_return_parts: tuple[TypeId, TypeId] | None = None
-					fn_is_void = False
-
-					# Decide can-throw for typing purposes.
-					# - Prefer the checker-provided effective mapping when available.
-					# - Otherwise fall back to any explicit signature flag (legacy).
-					fn_is_can_throw = (
-						can_throw_by_name.get(fn_name, False)
-						if can_throw_by_name is not None
-						else bool(sig.declared_can_throw) if sig else False
-					)
-
-					if sig and sig.return_type_id is not None:
-						# Surface return type is `T`. If the function is can-throw, the
-						# internal ABI return is `FnResult<T, Error>`.
-						fn_is_void = self._type_table.is_void(sig.return_type_id)
-						if fn_is_can_throw:
-							fn_return_parts = (sig.return_type_id, sig.error_type_id or self._error_type)
-						else:
-							# Legacy: older tests used FnResult as a surface return type.
-							td = self._type_table.get(sig.return_type_id)
-							if td.kind is TypeKind.FNRESULT and len(td.param_types) == 2:
-								fn_return_parts = (td.param_types[0], td.param_types[1])
-
-					for block in ssa.func.blocks.values():
-						for instr in block.instructions:
-							dest = getattr(instr, "dest", None)
-							if isinstance(instr, StoreLocal):
-								# Memory locals (address-taken) remain as StoreLocal even after SSA.
-								src_ty = ty_for(fn_name, instr.value)
-								if src_ty != self._unknown_type and value_types.get((fn_name, instr.local)) != src_ty:
-									value_types[(fn_name, instr.local)] = src_ty
-									changed = True
-							elif isinstance(instr, LoadLocal) and dest is not None:
-								# Propagate local type to the load destination.
-								local_ty = value_types.get((fn_name, instr.local))
-								if local_ty is not None and value_types.get((fn_name, dest)) != local_ty:
-									value_types[(fn_name, dest)] = local_ty
-									changed = True
-							elif isinstance(instr, AddrOfLocal) and dest is not None:
-								# Taking an address yields a reference type.
-								local_ty = value_types.get((fn_name, instr.local))
-								if local_ty is not None:
-									ref_ty = (
-										self._type_table.ensure_ref_mut(local_ty)
-										if getattr(instr, "is_mut", False)
-										else self._type_table.ensure_ref(local_ty)
-									)
-									if value_types.get((fn_name, dest)) != ref_ty:
-										value_types[(fn_name, dest)] = ref_ty
-										changed = True
-							elif isinstance(instr, AddrOfField) and dest is not None:
-								# Address-of field yields a reference to the field type.
-								ref_ty = (
-									self._type_table.ensure_ref_mut(instr.field_ty)
-									if getattr(instr, "is_mut", False)
-									else self._type_table.ensure_ref(instr.field_ty)
-								)
-								if value_types.get((fn_name, dest)) != ref_ty:
-									value_types[(fn_name, dest)] = ref_ty
-									changed = True
-							elif isinstance(instr, LoadRef) and dest is not None:
-								# Deref load result type is the element TypeId carried by the MIR.
-								if value_types.get((fn_name, dest)) != instr.inner_ty:
-									value_types[(fn_name, dest)] = instr.inner_ty
-									changed = True
-							elif isinstance(instr, StoreRef):
-								# Stores do not define a value; no typing needed.
-								pass
-							elif isinstance(instr, ConstructVariant) and dest is not None:
-								# Constructing a variant yields the declared variant TypeId.
-								if value_types.get((fn_name, dest)) != instr.variant_ty:
-									value_types[(fn_name, dest)] = instr.variant_ty
-									changed = True
-							elif isinstance(instr, VariantTag) and dest is not None:
-								# Variant tags are compared as integers in v1; use Uint for the tag.
-								if value_types.get((fn_name, dest)) != self._uint_type:
-									value_types[(fn_name, dest)] = self._uint_type
-									changed = True
-							elif isinstance(instr, VariantGetField) and dest is not None:
-								# Extracting a field yields the field TypeId carried by the MIR.
-								if value_types.get((fn_name, dest)) != instr.field_ty:
-									value_types[(fn_name, dest)] = instr.field_ty
-									changed = True
-							if isinstance(instr, ConstInt) and dest is not None:
-								if (fn_name, dest) not in value_types:
-									value_types[(fn_name, dest)] = self._int_type
-									changed = True
-							elif isinstance(instr, ConstBool) and dest is not None:
-								if (fn_name, dest) not in value_types:
-									value_types[(fn_name, dest)] = self._bool_type
-									changed = True
-							elif isinstance(instr, ConstString) and dest is not None:
-								if value_types.get((fn_name, dest)) != self._string_type:
-									value_types[(fn_name, dest)] = self._string_type
-									changed = True
-							elif isinstance(instr, StringLen) and dest is not None:
-								if value_types.get((fn_name, dest)) != self._uint_type:
-									value_types[(fn_name, dest)] = self._uint_type
-									changed = True
-							elif isinstance(instr, ArrayLen) and dest is not None:
-								if value_types.get((fn_name, dest)) != self._uint_type:
-									value_types[(fn_name, dest)] = self._uint_type
-									changed = True
-							elif isinstance(instr, ArrayCap) and dest is not None:
-								if value_types.get((fn_name, dest)) != self._uint_type:
-									value_types[(fn_name, dest)] = self._uint_type
-									changed = True
-							elif isinstance(instr, ArrayIndexLoad) and dest is not None:
-								if instr.elem_ty is not None and value_types.get((fn_name, dest)) != instr.elem_ty:
-									value_types[(fn_name, dest)] = instr.elem_ty
-									changed = True
-							elif isinstance(instr, ArrayLit) and dest is not None:
-								arr_ty = self._type_table.new_array(instr.elem_ty)
-								if value_types.get((fn_name, dest)) != arr_ty:
-									value_types[(fn_name, dest)] = arr_ty
-									changed = True
-							elif isinstance(instr, ConstructStruct) and dest is not None:
-								# Struct construction yields the nominal struct TypeId carried by MIR.
-								if value_types.get((fn_name, dest)) != instr.struct_ty:
-									value_types[(fn_name, dest)] = instr.struct_ty
-									changed = True
-							elif isinstance(instr, StructGetField) and dest is not None:
-								# Struct field access yields the field TypeId carried by MIR.
-								if value_types.get((fn_name, dest)) != instr.field_ty:
-									value_types[(fn_name, dest)] = instr.field_ty
-									changed = True
-							elif isinstance(instr, ConstructResultOk):
-								if dest is None:
-									continue
-								ok_ty = fn_return_parts[0] if fn_return_parts else ty_for(fn_name, instr.value)
-								err_ty = fn_return_parts[1] if fn_return_parts else self._error_type
-								dest_ty = self._type_table.ensure_fnresult(ok_ty, err_ty)
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, ConstructResultErr):
-								if dest is None:
-									continue
-								err_ty = ty_for(fn_name, instr.error)
-								ok_ty = fn_return_parts[0] if fn_return_parts else self._unknown_type
-								dest_ty = self._type_table.ensure_fnresult(ok_ty, err_ty)
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, ConstructError) and dest is not None:
-								if value_types.get((fn_name, dest)) != self._error_type:
-									value_types[(fn_name, dest)] = self._error_type
-									changed = True
-							elif isinstance(instr, ResultIsErr):
-								# result.is_err() -> Bool
-								if dest is not None and value_types.get((fn_name, dest)) != self._bool_type:
-									value_types[(fn_name, dest)] = self._bool_type
-									changed = True
-							elif isinstance(instr, ResultOk):
-								if dest is None:
-									continue
-								res_ty = ty_for(fn_name, instr.result)
-								if self._type_table.get(res_ty).kind is TypeKind.FNRESULT:
-									ok_ty, _err_ty = self._type_table.get(res_ty).param_types
-									dest_ty = ok_ty
-								else:
-									dest_ty = self._unknown_type
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, ResultErr):
-								if dest is None:
-									continue
-								res_ty = ty_for(fn_name, instr.result)
-								if self._type_table.get(res_ty).kind is TypeKind.FNRESULT:
-									_ok_ty, err_ty = self._type_table.get(res_ty).param_types
-									dest_ty = err_ty
-								else:
-									dest_ty = self._unknown_type
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, Call) and dest is not None:
-								callee_sig = signatures.get(instr.fn)
-								if callee_sig is not None:
-									if callee_sig.return_type_id is None:
-										rt_id, err_id = self._resolve_signature_types(callee_sig)
-										callee_sig.return_type_id = rt_id
-										callee_sig.error_type_id = err_id
-									callee_can_throw = (
-										can_throw_by_name.get(instr.fn, False)
-										if can_throw_by_name is not None
-										else bool(callee_sig.declared_can_throw)
-									)
-									if callee_can_throw:
-										ok_ty = callee_sig.return_type_id or self._unknown_type
-										err_ty = callee_sig.error_type_id or self._error_type
-										dest_ty = self._type_table.ensure_fnresult(ok_ty, err_ty)
-									else:
-										dest_ty = callee_sig.return_type_id or self._unknown_type
-										if is_void_tid(dest_ty):
-											continue
-								else:
-									dest_ty = self._unknown_type
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, AssignSSA):
-								if dest is None:
-									continue
-								src_ty = value_types.get((fn_name, instr.src))
-								if src_ty is not None and value_types.get((fn_name, dest)) != src_ty:
-									value_types[(fn_name, dest)] = src_ty
-									changed = True
-							elif isinstance(instr, UnaryOpInstr):
-								if dest is None:
-									continue
-								operand_ty = ty_for(fn_name, instr.operand)
-								if value_types.get((fn_name, dest)) != operand_ty:
-									value_types[(fn_name, dest)] = operand_ty
-									changed = True
-							elif isinstance(instr, BinaryOpInstr):
-								if dest is None:
-									continue
-								left_ty = ty_for(fn_name, instr.left)
-								right_ty = ty_for(fn_name, instr.right)
-								# If both operands agree, propagate that type; otherwise fall back to Unknown.
-								dest_ty = left_ty if left_ty == right_ty else self._unknown_type
-								if value_types.get((fn_name, dest)) != dest_ty:
-									value_types[(fn_name, dest)] = dest_ty
-									changed = True
-							elif isinstance(instr, Phi):
-								if dest is None:
-									continue
-								incoming = [value_types.get((fn_name, v)) for v in instr.incoming.values()]
-								incoming = [t for t in incoming if t is not None]
-								if incoming and all(t == incoming[0] for t in incoming):
-									ty = incoming[0]
-									if value_types.get((fn_name, dest)) != ty:
-										value_types[(fn_name, dest)] = ty
-										changed = True
-
-						term = block.terminator
-						if hasattr(term, "value") and getattr(term, "value") is not None:
-							val = term.value
-							# Do not overwrite an existing concrete type; only seed a type for
-							# returns that have not been seen yet.
-							if (fn_name, val) not in value_types and not fn_is_void:
-								if fn_return_parts is not None:
-									ty = self._type_table.ensure_fnresult(fn_return_parts[0], fn_return_parts[1])
-								else:
-									ty = self._unknown_type
-								value_types[(fn_name, val)] = ty
+				for block in ssa.func.blocks.values():
+					for instr in block.instructions:
+						kind = type(instr)
+						if kind is StoreLocal:
+							# Memory locals (address-taken) remain as StoreLocal even after SSA.
+							src_ty = ty_for(fn_name, instr.value)
+							local_key = (fn_name, instr.local)
+							if src_ty != self._unknown_type and value_types.get(local_key) != src_ty:
+								value_types[local_key] = src_ty
 								changed = True
+							continue
+						handler = dest_handlers.get(kind)
+						if handler is None:
+							continue
+						# Every class in `dest_handlers` declares a `dest` field.
+						dest = instr.dest
+						if dest is None:
+							continue
+						dest_ty = handler(fn_name, instr, dest, fn_return_parts)
+						if dest_ty is None:
+							continue
+						# Converged rounds only read; the store happens on change.
+						dest_key = (fn_name, dest)
+						if value_types.get(dest_key) != dest_ty:
+							value_types[dest_key] = dest_ty
+							changed = True
+
+					term = block.terminator
+					if type(term) is Return and term.value is not None and not fn_is_void:
+						ret_key = (fn_name, term.value)
+						# Do not overwrite an existing concrete type; only seed a type for
+						# returns that have not been seen yet.
+						if ret_key not in value_types:
+							if fn_return_parts is not None:
+								ty = self._type_table.ensure_fnresult(fn_return_parts[0], fn_return_parts[1])
+							else:
+								ty = self._unknown_type
+							value_types[ret_key] = ty
+							changed = True
+				if not changed:
+					break
 
 		if not value_types:
 			return None
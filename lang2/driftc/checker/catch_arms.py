@@ -11,7 +11,7 @@ shapes, but user-facing diagnostics belong here.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, Sequence, Set
+from typing import AbstractSet, Optional, Sequence, Set
 
 from lang2.driftc.core.diagnostics import Diagnostic
 from lang2.driftc.core.span import Span
@@ -50,7 +50,7 @@ def _report(
 
 def validate_catch_arms(
 	arms: Sequence[CatchArmInfo],
-	known_events: Set[str],
+	known_events: AbstractSet[str],
 	diagnostics: Optional[list[Diagnostic]] = None,
 ) -> None:
 	"""
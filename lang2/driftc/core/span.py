@@ -49,4 +49,9 @@ class Span:
 		)
 
 
-__all__ = ["Span"]
+# Shared "no location" span. Span is frozen, so nodes without a source
+# location can all point at this one instance instead of allocating their own.
+NO_SPAN = Span()
+
+
+__all__ = ["Span", "NO_SPAN"]
@@ -137,6 +137,7 @@ _EXPR_PARSER = Lark(
 	start="expr",
 	propagate_positions=True,
 	maybe_placeholders=False,
+	cache=True,
 )
 
 
@@ -794,6 +795,7 @@ _PARSER = Lark(
     propagate_positions=True,
     maybe_placeholders=False,
     postlex=DriftPostLex(),
+    cache=True,
 )
 
 
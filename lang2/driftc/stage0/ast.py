@@ -12,84 +12,84 @@ Pipeline placement:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional, Union
 
-from lang2.driftc.core.span import Span
+from lang2.driftc.core.span import NO_SPAN, Span
 
 
 # Base classes
 
 class Node:
 	"""Base class for all AST nodes (minimal)."""
-	pass
+	__slots__ = ()
 
 
 class Expr(Node):
 	"""Base class for expressions."""
-	pass
+	__slots__ = ()
 
 
 class TraitExpr(Expr):
 	"""Trait guard expression (type-level boolean)."""
-	pass
+	__slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class TraitIs(TraitExpr):
 	subject: str
 	trait: object
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class TraitAnd(TraitExpr):
 	left: TraitExpr
 	right: TraitExpr
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class TraitOr(TraitExpr):
 	left: TraitExpr
 	right: TraitExpr
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class TraitNot(TraitExpr):
 	expr: TraitExpr
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
 class Stmt(Node):
 	"""Base class for statements."""
-	pass
+	__slots__ = ()
 
 
 # Expressions
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expr):
 	"""Literal value (int, string, or bool)."""
 	value: Union[int, str, bool]
 	loc: Optional[object] = None  # placeholder for source location
 
 
-@dataclass
+@dataclass(slots=True)
 class Name(Expr):
 	"""Identifier reference."""
 	ident: str
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Placeholder(Expr):
 	"""Receiver placeholder (dot-shortcut) before desugaring."""
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Attr(Expr):
 	"""Attribute access: value.attr."""
 	value: Expr
@@ -97,7 +97,7 @@ class Attr(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QualifiedMember(Expr):
 	"""
 	Type-level qualified member reference: `TypeRef::member`.
@@ -114,10 +114,10 @@ class QualifiedMember(Expr):
 
 	base_type_expr: object
 	member: str
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(Expr):
 	"""Function or method call prior to desugaring."""
 	func: Expr
@@ -127,7 +127,7 @@ class Call(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeApp(Expr):
 	"""Explicit type application on a callable reference (no call)."""
 	func: Expr
@@ -135,7 +135,7 @@ class TypeApp(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Lambda(Expr):
 	"""Lambda expression: params + body (expr or block)."""
 	params: List["Param"]
@@ -146,7 +146,7 @@ class Lambda(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureItem:
 	"""Explicit capture list item for a lambda."""
 	name: str
@@ -154,14 +154,14 @@ class CaptureItem:
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(Expr):
 	"""Block expression: sequence of statements and an optional trailing expression."""
 	statements: List[Stmt]
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class KwArg:
 	"""
 	Keyword argument `name = value` (used by calls and exception constructors).
@@ -171,10 +171,10 @@ class KwArg:
 	"""
 	name: str
 	value: Expr
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class Param:
 	"""Function/lambda parameter (name + optional parsed type)."""
 	name: str
@@ -182,7 +182,7 @@ class Param:
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Binary(Expr):
 	"""Binary operator expression."""
 	op: str
@@ -191,7 +191,7 @@ class Binary(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Unary(Expr):
 	"""Unary operator expression."""
 	op: str
@@ -199,7 +199,7 @@ class Unary(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Move(Expr):
 	"""
 	Ownership transfer: `move <expr>`.
@@ -216,7 +216,7 @@ class Move(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Index(Expr):
 	"""Indexing expression: value[index]."""
 	value: Expr
@@ -224,14 +224,14 @@ class Index(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayLiteral(Expr):
 	"""Array literal placeholder used in early AST; semantics refined later."""
 	elements: List[Expr]
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionCtor(Expr):
 	"""
 	Exception constructor application (throw-only in the surface language).
@@ -248,7 +248,7 @@ class ExceptionCtor(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CatchExprArm:
 	"""Single catch arm in a try/catch expression."""
 	event: Optional[str]
@@ -257,7 +257,7 @@ class CatchExprArm:
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TryCatchExpr(Expr):
 	"""Expression-form try/catch (lowered later)."""
 	attempt: Expr
@@ -265,7 +265,7 @@ class TryCatchExpr(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchArm:
 	"""
 	Single `match` arm.
@@ -291,10 +291,10 @@ class MatchArm:
 	# Field names for named binders, parallel to `binders`. Only meaningful when
 	# `pattern_arg_form == "named"`.
 	binder_fields: Optional[List[str]] = None
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchExpr(Expr):
 	"""Expression-form `match` (expression-only in MVP)."""
 
@@ -303,7 +303,7 @@ class MatchExpr(Expr):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Ternary(Expr):
 	"""Conditional expression: cond ? then_expr : else_expr."""
 	cond: Expr
@@ -313,7 +313,7 @@ class Ternary(Expr):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class FStringHole:
 	"""
 	Single hole `{expr[:spec]}` inside an f-string.
@@ -326,7 +326,7 @@ class FStringHole:
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FString(Expr):
 	"""
 	f-string literal `f"..."`.
@@ -340,7 +340,7 @@ class FString(Expr):
 
 # Statements
 
-@dataclass
+@dataclass(slots=True)
 class LetStmt(Stmt):
 	"""
 	Binding introduction (`val` / `var`).
@@ -356,7 +356,7 @@ class LetStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(Stmt):
 	"""Assignment to an expression target."""
 	target: Expr
@@ -364,7 +364,7 @@ class AssignStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AugAssignStmt(Stmt):
 	"""
 	Augmented assignment statement.
@@ -383,7 +383,7 @@ class AugAssignStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Stmt):
 	"""If/else statement with explicit blocks."""
 	cond: Expr
@@ -392,35 +392,35 @@ class IfStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Stmt):
 	"""Function return with optional value."""
 	value: Optional[Expr]
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaiseStmt(Stmt):
 	"""Raise expression value as an error (placeholder)."""
 	value: Expr
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(Stmt):
 	"""Expression used for side effects as a statement."""
 	expr: Expr
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStmt(Stmt):
 	"""Import statement placeholder (path-only for now)."""
 	path: str
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TryStmt(Stmt):
 	"""Statement-form try/catch placeholder."""
 	body: List[Stmt]
@@ -428,7 +428,7 @@ class TryStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Stmt):
 	"""While loop: while cond { body }."""
 	cond: Expr
@@ -436,7 +436,7 @@ class WhileStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStmt(Stmt):
 	"""Foreach loop: for iter_var in iterable { body }."""
 	iter_var: str
@@ -445,29 +445,29 @@ class ForStmt(Stmt):
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakStmt(Stmt):
 	"""Loop break."""
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStmt(Stmt):
 	"""Loop continue."""
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThrowStmt(Stmt):
 	"""Throw statement placeholder."""
 	value: Expr
 	loc: Optional[object] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RethrowStmt(Stmt):
 	"""Rethrow the currently caught error; only valid inside a catch."""
-	loc: Span = field(default_factory=Span)
+	loc: Span = NO_SPAN
 
 
 __all__ = [
@@ -0,0 +1,46 @@
+from lang2.driftc.checker import Checker, FnSignature
+from lang2.driftc.core.generic_type_expr import GenericTypeExpr
+from lang2.driftc.core.types_core import TypeKind, TypeTable, VariantArmSchema, VariantFieldSchema
+
+
+def test_legacy_return_shapes_resolve_once():
+	table = TypeTable()
+	signatures = {
+		"f": FnSignature(name="f", return_type=("FnResult", "Int", "Error"), param_types=["Point", "Array<Int>"]),
+		"g": FnSignature(name="g", return_type=("FnResult", "Int", "Error"), param_types=["Point", "Array<Int>"]),
+		"h": FnSignature(name="h", return_type="FnResult<Int, Error>"),
+		"k": FnSignature(name="k", return_type="FnResult<Int, Error>"),
+	}
+	checked = Checker(signatures=signatures, type_table=table).check(signatures.keys())
+	infos = checked.fn_infos
+	assert infos["f"].return_type_id == infos["g"].return_type_id
+	assert infos["f"].error_type_id == infos["g"].error_type_id
+	assert infos["f"].signature.param_type_ids == infos["g"].signature.param_type_ids
+	assert infos["h"].return_type_id == infos["k"].return_type_id
+
+
+def test_unknown_shapes_resolve_once_declared():
+	table = TypeTable()
+	signatures = {
+		"a": FnSignature(name="a", return_type=("FnResult", "Optional<Int>", "Error")),
+		"b": FnSignature(name="b", return_type=("FnResult", "Optional<Int>", "Error")),
+	}
+	checker = Checker(signatures=signatures, type_table=table)
+
+	before = checker.check(["a"]).fn_infos["a"]
+	assert table.get(table.get(before.return_type_id).param_types[0]).kind is TypeKind.UNKNOWN
+
+	table.declare_variant(
+		module_id="lang.core",
+		name="Optional",
+		type_params=["T"],
+		arms=[
+			VariantArmSchema(
+				name="Some",
+				fields=[VariantFieldSchema(name="value", type_expr=GenericTypeExpr.param(0))],
+			),
+			VariantArmSchema(name="None", fields=[]),
+		],
+	)
+	after = checker.check(["b"]).fn_infos["b"]
+	assert table.get(table.get(after.return_type_id).param_types[0]).kind is TypeKind.VARIANT
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("llvmlite")
+
+from llvmlite import ir
+
+from lang.ssa_codegen import _fold_int_binary
+
+I64 = ir.IntType(64)
+I1 = ir.IntType(1)
+
+
+def test_fold_wraps_to_operand_width() -> None:
+    folded = _fold_int_binary("+", ir.Constant(I64, 2**63 - 1), ir.Constant(I64, 1))
+    assert folded is not None
+    assert folded.type == I64
+    assert folded.constant == -(2**63)
+
+
+def test_fold_compares_signed() -> None:
+    assert _fold_int_binary("<", ir.Constant(I64, -1), ir.Constant(I64, 0)).constant == 1
+    # i1 1 is -1 when read as signed, matching icmp slt.
+    assert _fold_int_binary("<", ir.Constant(I1, 1), ir.Constant(I1, 0)).constant == 1
+
+
+def test_fold_skips_non_constants() -> None:
+    fn = ir.Function(ir.Module(), ir.FunctionType(I64, [I64]), name="f")
+    assert _fold_int_binary("+", fn.args[0], ir.Constant(I64, 1)) is None
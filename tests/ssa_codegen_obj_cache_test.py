@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("llvmlite")
+
+from lang.ssa_codegen import emit_dummy_main_object
+
+
+def test_object_cache_reuses_entry(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "objcache"
+    monkeypatch.setenv("DRIFT_OBJ_CACHE", str(cache_dir))
+    first = tmp_path / "a.o"
+    second = tmp_path / "b.o"
+    emit_dummy_main_object(first)
+    entries = list(cache_dir.iterdir())
+    assert len(entries) == 1 and entries[0].suffix == ".o"
+    emit_dummy_main_object(second)
+    assert list(cache_dir.iterdir()) == entries
+    assert first.read_bytes() == second.read_bytes() == entries[0].read_bytes()
+
+
+def test_object_cache_disabled_when_unset(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DRIFT_OBJ_CACHE", "")
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "out" / "a.o"
+    emit_dummy_main_object(out)
+    assert out.read_bytes()
+    assert [p.name for p in tmp_path.iterdir()] == ["out"]
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["a.o"]
+